@@ -0,0 +1,4 @@
+# Load .env.local once, before any client module reads os.environ
+from scripts.config import load_env
+
+load_env()
@@ -1,65 +1,163 @@
 """
 Batch scraper for founders from CSV file.
-Scrapes all founders one by one and saves individual .md files.
+Scrapes founders concurrently and saves individual .md files.
 """
 import csv
+import hashlib
+import itertools
+import logging
 import os
+import queue
+import signal
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Optional
+
+import orjson
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from scripts.config import CACHE_DIR, OUTPUT_DIR
 from scripts.scrapers.apis.founder_scraper import FounderScraper
+from scripts.scrapers.urls import safe_slug
+
+CHECKPOINT_PATH = CACHE_DIR / "batch_checkpoint.json"
+
+# Response caches are also written every this many scraped founders, so a
+# crash only loses the API responses fetched since the last save
+CACHE_SAVE_EVERY = 25
+
+
+# Notifications are sent by a daemon thread so osascript never blocks scraping.
+# The thread is started by the first batch_scrape() call, not on import.
+_notify_queue: queue.Queue = queue.Queue(maxsize=16)
+_notify_thread: Optional[threading.Thread] = None
+_notify_lock = threading.Lock()
+
+
+def _notify_worker():
+    while True:
+        title, message = _notify_queue.get()
+        try:
+            subprocess.run([
+                'osascript', '-e',
+                f'display notification "{message}" with title "{title}"'
+            ], check=True)
+        except Exception:
+            pass  # Ignore notification errors
+        finally:
+            _notify_queue.task_done()
+
+
+def _start_notify_thread():
+    global _notify_thread
+    with _notify_lock:
+        if _notify_thread is None:
+            _notify_thread = threading.Thread(target=_notify_worker, name="notify", daemon=True)
+            _notify_thread.start()
 
 
 def notify_macos(title: str, message: str):
-    """Send macOS notification."""
+    """Queue a macOS notification (sent in the background)."""
     try:
-        subprocess.run([
-            'osascript', '-e',
-            f'display notification "{message}" with title "{title}"'
-        ], check=True)
-    except Exception:
-        pass  # Ignore notification errors
+        _notify_queue.put_nowait((title, message))
+    except queue.Full:
+        pass  # Drop notifications rather than stall the scraper
 
 
-def batch_scrape(csv_path: str, max_results: int = 5, start_from: int = 0):
+def config_hash(csv_path: str, max_results: int) -> str:
+    """Identifies a run's inputs: a checkpoint is only resumed by the same CSV and max_results."""
+    return hashlib.sha256(f"{Path(csv_path).resolve()}|{max_results}".encode()).hexdigest()
+
+
+def load_checkpoint(path: Path, config_hash: str) -> dict:
+    """Load the checkpoint state, or start a fresh one if it belongs to another run."""
+    if path.exists():
+        try:
+            state = orjson.loads(path.read_bytes())
+            if state.get("config_hash") == config_hash:
+                return state
+        except (OSError, ValueError):
+            pass  # Corrupt checkpoint: start over
+
+    return {
+        "config_hash": config_hash,
+        "started_at": datetime.now().isoformat(),
+        "completed": [],
+        "failed": []
+    }
+
+
+def save_checkpoint(path: Path, state: dict):
+    """Write the checkpoint atomically (temp file + rename)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(state, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
+
+
+def batch_scrape(
+    csv_path: str,
+    max_results: int = 5,
+    start_from: int = 0,
+    workers: int = 4,
+    use_cache: bool = True
+):
     """
     Scrape all founders from CSV file.
 
+    Founders are scraped concurrently by a pool of worker threads; each
+    founder is an independent, network-bound job.
+
     Args:
         csv_path: Path to CSV file
         max_results: Max results per source per founder
         start_from: Index to start from (for resuming)
+        workers: Number of founders scraped in parallel
+
+    Progress is checkpointed to CHECKPOINT_PATH after every founder, so an
+    interrupted run with the same CSV and max_results resumes where it stopped.
     """
-    # Read CSV
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        founders = list(reader)
+    _start_notify_thread()
 
-    total = len(founders)
     print(f"\n{'='*60}")
-    print(f"🚀 BATCH SCRAPER - {total} founders")
+    print(f"🚀 BATCH SCRAPER - {csv_path} ({workers} workers)")
     print(f"{'='*60}\n")
 
-    # Initialize scraper
-    scraper = FounderScraper()
+    # Resume state
+    checkpoint = load_checkpoint(CHECKPOINT_PATH, config_hash(csv_path, max_results))
+    completed = set(checkpoint["completed"])
+    failed_indices = set(checkpoint["failed"])
+    if completed:
+        print(f"♻️  Resuming from checkpoint: {len(completed)} founders already done\n")
 
-    # Stats
-    success = 0
-    failed = 0
-    skipped = 0
-    start_time = datetime.now()
+    def _flush_checkpoint():
+        checkpoint["completed"] = sorted(completed)
+        checkpoint["failed"] = sorted(failed_indices)
+        save_checkpoint(CHECKPOINT_PATH, checkpoint)
+
+    # Initialize scraper (shared: its httpx clients are thread-safe)
+    scraper = FounderScraper(use_cache=use_cache)
+    output_dir = OUTPUT_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Process each founder
-    for i, row in enumerate(founders):
-        # Skip if before start_from
-        if i < start_from:
-            continue
+    # Profiles already generated (one directory read instead of a stat per founder)
+    existing = {
+        entry.name[:-len(".md")]
+        for entry in os.scandir(output_dir)
+        if entry.name.endswith(".md")
+    }
+
+    def _scrape_one(i: int, row: dict) -> tuple[str, str]:
+        """Scrape a single founder. Returns (status, message)."""
+        if i in completed:
+            return "skipped", f"#{i+1} - Already done (checkpoint)"
 
         # Extract name and company
         first_name = row.get('firstName', '').strip()
@@ -69,22 +167,15 @@ def batch_scrape(csv_path: str, max_results: int = 5, start_from: int = 0):
         full_name = f"{first_name} {last_name}".strip()
 
         if not full_name:
-            print(f"[{i+1}/{total}] ⏭️  Skipped (no name)")
-            skipped += 1
-            continue
+            return "skipped", "(no name)"
 
         # Check if already scraped
-        safe_name = full_name.lower().replace(' ', '-')
-        safe_name = ''.join(c for c in safe_name if c.isalnum() or c == '-')
-        output_path = Path(__file__).parent.parent / "data" / "output" / f"{safe_name}.md"
-
-        if output_path.exists():
-            print(f"[{i+1}/{total}] ⏭️  {full_name} - Already exists")
-            skipped += 1
-            continue
+        safe_name = safe_slug(full_name)
+        if safe_name in existing:
+            return "skipped", f"{full_name} - Already exists"
 
         # Scrape
-        print(f"\n[{i+1}/{total}] 🔍 {full_name} ({company})")
+        print(f"\n[{i+1}] 🔍 {full_name} ({company})")
         print("-" * 40)
 
         try:
@@ -93,50 +184,122 @@ def batch_scrape(csv_path: str, max_results: int = 5, start_from: int = 0):
                 company_name=company if company else None,
                 max_results=max_results
             )
-            success += 1
-            print(f"✅ Done: {full_name}")
-
+            existing.add(safe_name)
+            return "success", full_name
         except Exception as e:
-            failed += 1
-            print(f"❌ Error: {full_name} - {e}")
-
-        # Notification every 10 founders
-        if (success + failed) % 10 == 0 and (success + failed) > 0:
-            elapsed = datetime.now() - start_time
-            rate = (success + failed) / elapsed.total_seconds() * 60  # per minute
-            remaining = total - (i + 1)
-            eta_minutes = remaining / rate if rate > 0 else 0
-
-            msg = f"✅ {success} OK, ❌ {failed} failed, ⏭️ {skipped} skipped"
-            notify_macos(
-                f"Scraping: {i+1}/{total}",
-                msg
-            )
-            print(f"\n📊 Progress: {i+1}/{total} | {msg}")
-            print(f"⏱️  Rate: {rate:.1f}/min | ETA: {eta_minutes:.0f} min\n")
+            return "failed", f"{full_name} - {e}"
 
-        # Small delay to avoid rate limiting
-        time.sleep(1)
+    # Stats
+    success = 0
+    failed = 0
+    skipped = 0
+    done = 0
+    start_time = time.monotonic()
 
-    # Final stats
-    elapsed = datetime.now() - start_time
+    # Flush the checkpoint on Ctrl+C before stopping
+    previous_handler = None
+    if threading.current_thread() is threading.main_thread():
+        def _on_sigint(signum, frame):
+            _flush_checkpoint()
+            raise KeyboardInterrupt
 
-    print(f"\n{'='*60}")
-    print(f"🏁 FINISHED")
-    print(f"{'='*60}")
-    print(f"✅ Success: {success}")
-    print(f"❌ Failed: {failed}")
-    print(f"⏭️  Skipped: {skipped}")
-    print(f"⏱️  Duration: {elapsed}")
-    print(f"{'='*60}\n")
+        previous_handler = signal.signal(signal.SIGINT, _on_sigint)
 
-    # Final notification
-    notify_macos(
-        "Scraping terminé !",
-        f"✅ {success} OK, ❌ {failed} failed, ⏭️ {skipped} skipped"
-    )
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scrape")
+    try:
+        # Stream rows from the CSV, skipping those before start_from. Lines are
+        # decoded from a binary file so that f.tell() tracks progress for the ETA.
+        with open(csv_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            rows = (row for row in csv.reader(line.decode('utf-8') for line in f) if row)
+            fieldnames = next(rows, [])
+            for _ in itertools.islice(rows, start_from):
+                pass
+            start_offset = f.tell()
+            indexed_rows = enumerate(rows, start=start_from)
 
-    scraper.close()
+            # At most `window` founders in flight: rows are only read as workers free up
+            window = workers * 2
+            futures: dict = {}
+
+            def _submit(count: int):
+                for i, row in itertools.islice(indexed_rows, count):
+                    futures[executor.submit(_scrape_one, i, dict(zip(fieldnames, row)))] = i
+
+            _submit(window)
+            while futures:
+                finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                _submit(len(finished))
+
+                for future in finished:
+                    i = futures.pop(future)
+                    status, message = future.result()
+                    done += 1
+
+                    if status == "skipped":
+                        skipped += 1
+                        print(f"[{start_from + done}] ⏭️  Skipped {message}")
+                        continue
+                    elif status == "success":
+                        success += 1
+                        completed.add(i)
+                        failed_indices.discard(i)
+                        print(f"✅ Done: {message}")
+                    else:
+                        failed += 1
+                        failed_indices.add(i)
+                        print(f"❌ Error: {message}")
+
+                    _flush_checkpoint()
+                    if (success + failed) % CACHE_SAVE_EVERY == 0:
+                        scraper.save_caches()
+
+                    # Notification every 10 founders
+                    if (success + failed) % 10 == 0:
+                        elapsed = time.monotonic() - start_time
+                        rate = (success + failed) / elapsed * 60  # per minute
+                        # Share of the CSV read so far (ahead of `done` by the window)
+                        read = f.tell() - start_offset
+                        left = size - f.tell()
+                        eta_minutes = elapsed * left / read / 60 if read > 0 else 0
+
+                        msg = f"✅ {success} OK, ❌ {failed} failed, ⏭️ {skipped} skipped"
+                        notify_macos(
+                            f"Scraping: {start_from + done} done",
+                            msg
+                        )
+                        print(f"\n📊 Progress: {start_from + done} done, {f.tell() / size:.0%} of CSV | {msg}")
+                        print(f"⏱️  Rate: {rate:.1f}/min | ETA: {eta_minutes:.0f} min\n")
+
+        # Final stats
+        elapsed = timedelta(seconds=time.monotonic() - start_time)
+
+        print(f"\n{'='*60}")
+        print(f"🏁 FINISHED")
+        print(f"{'='*60}")
+        print(f"👥 Founders: {start_from + done}")
+        print(f"✅ Success: {success}")
+        print(f"❌ Failed: {failed}")
+        print(f"⏭️  Skipped: {skipped}")
+        print(f"⏱️  Duration: {elapsed}")
+        print(f"{'='*60}\n")
+
+        # Final notification
+        notify_macos(
+            "Scraping terminé !",
+            f"✅ {success} OK, ❌ {failed} failed, ⏭️ {skipped} skipped"
+        )
+    except KeyboardInterrupt:
+        print(f"\n⏸️  Interrupted - progress saved to {CHECKPOINT_PATH}")
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    finally:
+        executor.shutdown(wait=True)
+        if previous_handler is not None:
+            signal.signal(signal.SIGINT, previous_handler)
+        # Saves the response caches, also when interrupted or failing
+        scraper.close()
+        _notify_queue.join()  # Let pending notifications go out before exit
 
 
 if __name__ == "__main__":
@@ -146,7 +309,19 @@ if __name__ == "__main__":
     parser.add_argument("csv", type=str, help="Path to CSV file")
     parser.add_argument("--max", type=int, default=5, help="Max results per source")
     parser.add_argument("--start", type=int, default=0, help="Start from index (for resuming)")
+    parser.add_argument("--workers", type=int, default=4, help="Number of founders scraped in parallel")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the cached API responses in data/cache")
 
     args = parser.parse_args()
 
-    batch_scrape(args.csv, max_results=args.max, start_from=args.start)
+    # Progress from our own modules at INFO; third-party libraries (httpx) stay at WARNING
+    logging.basicConfig(format="  %(message)s")
+    logging.getLogger("scripts").setLevel(logging.INFO)
+
+    batch_scrape(
+        args.csv,
+        max_results=args.max,
+        start_from=args.start,
+        workers=args.workers,
+        use_cache=not args.no_cache
+    )
@@ -0,0 +1,28 @@
+"""
+Shared project paths and .env.local loading.
+"""
+import os
+from functools import cache
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / "data"
+OUTPUT_DIR = DATA_DIR / "output"
+CACHE_DIR = DATA_DIR / "cache"
+ENV_FILE = PROJECT_ROOT / ".env.local"
+
+
+@cache
+def load_env(env_file: Path = ENV_FILE):
+    """Load KEY=VALUE pairs from .env.local into os.environ (once per process)."""
+    if env_file.exists():
+        with env_file.open() as f:
+            for line in f:
+                line = line.rstrip('\r\n')
+                key, sep, value = line.partition('=')
+                if sep and not line.startswith('#'):
+                    value = value.strip()
+                    # KEY="value" / KEY='value': drop one pair of matching quotes
+                    if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+                        value = value[1:-1]
+                    os.environ.setdefault(key.strip(), value)
@@ -2,7 +2,10 @@
 """
 Main enrichment pipeline for founder profiles.
 """
+import asyncio
 import json
+import logging
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -15,41 +18,88 @@ from scripts.scrapers.linkedin.phantombuster import PhantombusterClient
 from scripts.scrapers.apis.youtube import YouTubeClient
 from scripts.scrapers.apis.google_search import GoogleSearchClient
 from scripts.scrapers.apis.podcasts import ListenNotesClient
+from scripts.scrapers.transport import shared_transport
+
+try:
+    from scripts.enrichment.relevance_filter import RelevanceFilter
+    _HAS_FILTER = True
+except ImportError:  # openai not installed
+    _HAS_FILTER = False
 from scripts.synthesis.llm_synthesizer import generate_enriched_profile
 
 
 class FounderEnrichmentPipeline:
     """Pipeline to enrich a single founder profile."""
 
-    def __init__(self, use_phantombuster: bool = True):
+    # Source name -> (enriched_data key, label, unit counted in "total_found")
+    SOURCE_FIELDS = {
+        "linkedin_profile": ("linkedin_full", "LinkedIn profile", None),
+        "linkedin_activity": ("linkedin_posts", "LinkedIn activity", None),
+        "youtube": ("youtube_results", "YouTube", "videos"),
+        "google_search": ("google_results", "Google", "results"),
+        "podcasts": ("podcast_results", "Podcasts", "episodes"),
+    }
+
+    # enriched_data key -> (relevance source id, key of the result list to filter)
+    FILTERED_RESULTS = {
+        "youtube_results": ("youtube", "all_videos"),
+        "google_results": ("google", "all_results"),
+        "podcast_results": ("podcasts", "episodes"),
+    }
+
+    # Optional media clients: (attribute, client class, required env vars, label)
+    OPTIONAL_CLIENTS = [
+        ("youtube_client", YouTubeClient, ("YOUTUBE_API_KEY",), "YouTube API"),
+        ("google_client", GoogleSearchClient, ("GOOGLE_API_KEY", "GOOGLE_SEARCH_ENGINE_ID"), "Google Search API"),
+        ("podcast_client", ListenNotesClient, ("LISTENNOTES_API_KEY",), "Listen Notes API"),
+    ]
+
+    # Clients whose searches can filter by relevance themselves: they share the pipeline's filter
+    FILTERING_CLIENTS = frozenset({"youtube_client", "google_client"})
+
+    def __init__(self, use_phantombuster: bool = True, use_llm_filter: bool = False):
+        # Checked first, before any client (and connection pool) is created
+        if use_llm_filter and not _HAS_FILTER:
+            raise ImportError("--llm-filter requires the openai package (pip install openai)")
+
+        # One connection pool for all HTTP clients of the pipeline
+        self.transport = shared_transport()
+
         self.use_phantombuster = use_phantombuster
         if use_phantombuster:
-            self.pb_client = PhantombusterClient()
+            self.pb_client = PhantombusterClient(transport=self.transport)
         else:
             self.pb_client = None
 
-        # Initialize media content clients (optional - will skip if not configured)
-        self.youtube_client = None
-        self.google_client = None
-        self.podcast_client = None
+        # One relevance filter (and decision cache) for the whole pipeline
+        self.relevance_filter = None
+        if use_llm_filter:
+            try:
+                self.relevance_filter = RelevanceFilter()
+            except ValueError:
+                print("  [!] LLM relevance filter not configured (OPENAI_API_KEY missing)")
 
-        try:
-            self.youtube_client = YouTubeClient()
-        except ValueError:
-            print("  [!] YouTube API not configured (YOUTUBE_API_KEY missing)")
+        # Initialize media content clients (optional - skipped if their keys are not set)
+        for attr, client_cls, env_keys, label in self.OPTIONAL_CLIENTS:
+            if all(os.environ.get(key) for key in env_keys):
+                kwargs = {"relevance_filter": self.relevance_filter} if attr in self.FILTERING_CLIENTS else {}
+                setattr(self, attr, client_cls(transport=self.transport, **kwargs))
+            else:
+                setattr(self, attr, None)
+                print(f"  [!] {label} not configured ({' or '.join(env_keys)} missing)")
 
-        try:
-            self.google_client = GoogleSearchClient()
-        except ValueError:
-            print("  [!] Google Search API not configured (GOOGLE_API_KEY or GOOGLE_SEARCH_ENGINE_ID missing)")
+    def _scrape_linkedin(self, phantom: str, scrape, *args, **kwargs) -> dict:
+        """Run a Phantombuster scrape; its result records are added under "result" (None if unavailable)."""
+        output = scrape(*args, **kwargs)
+        output["result"] = self.pb_client.get_result_records(self.pb_client.PHANTOMS[phantom])
+        return output
 
-        try:
-            self.podcast_client = ListenNotesClient()
-        except ValueError:
-            print("  [!] Listen Notes API not configured (LISTENNOTES_API_KEY missing)")
+    async def enrich_profile_async(self, profile: FounderProfile, skip_phantombuster: bool = False) -> dict:
+        """Collect enrichment data from all sources concurrently.
 
-    def enrich_profile(self, profile: FounderProfile, skip_phantombuster: bool = False) -> dict:
-        """Collect enrichment data from all sources."""
+        The clients are synchronous, so each source call runs in a worker
+        thread and all of them are awaited together.
+        """
         enriched_data = {
             "linkedin_full": {},
             "linkedin_posts": [],
@@ -61,65 +111,97 @@ class FounderEnrichmentPipeline:
 
         print(f"\nEnriching: {profile.name}")
 
-        # 1. LinkedIn Profile Scraper (Phantombuster)
+        tasks = {}
+
+        # 1-2. LinkedIn Profile Scraper + Activity Extractor (Phantombuster)
         if not skip_phantombuster and self.pb_client and profile.linkedin_url:
-            try:
-                print("  - Fetching LinkedIn profile (Phantombuster)...")
-                linkedin_data = self.pb_client.scrape_linkedin_profile(profile.linkedin_url)
-                enriched_data["linkedin_full"] = linkedin_data
-                enriched_data["sources_used"].append("linkedin_profile")
-                print(f"    ✓ LinkedIn profile: OK")
-            except Exception as e:
-                print(f"    ✗ LinkedIn profile error: {e}")
-
-            # 2. LinkedIn Activity Extractor (Phantombuster)
-            try:
-                print("  - Fetching LinkedIn activity (Phantombuster)...")
-                activity_data = self.pb_client.scrape_linkedin_activity(profile.linkedin_url, max_posts=25)
-                enriched_data["linkedin_posts"] = activity_data
-                enriched_data["sources_used"].append("linkedin_activity")
-                print(f"    ✓ LinkedIn activity: OK")
-            except Exception as e:
-                print(f"    ✗ LinkedIn activity error: {e}")
+            print("  - Fetching LinkedIn profile & activity (Phantombuster)...")
+            tasks["linkedin_profile"] = asyncio.to_thread(
+                self._scrape_linkedin, "linkedin_profile",
+                self.pb_client.scrape_linkedin_profile, profile.linkedin_url
+            )
+            tasks["linkedin_activity"] = asyncio.to_thread(
+                self._scrape_linkedin, "linkedin_activity",
+                self.pb_client.scrape_linkedin_activity, profile.linkedin_url, max_posts=25
+            )
         else:
             print("  - Skipping Phantombuster enrichment")
 
         # 3. YouTube - Find video content about the person
         if self.youtube_client:
-            try:
-                print("  - Searching YouTube for video content...")
-                youtube_data = self.youtube_client.search_person_content(profile.name, max_results=10)
-                enriched_data["youtube_results"] = youtube_data
-                enriched_data["sources_used"].append("youtube")
-                print(f"    ✓ YouTube: {youtube_data['total_found']} videos found")
-            except Exception as e:
-                print(f"    ✗ YouTube error: {e}")
+            print("  - Searching YouTube for video content...")
+            tasks["youtube"] = asyncio.to_thread(
+                self.youtube_client.search_person_content, profile.name, max_results=10
+            )
 
         # 4. Google Search - Find articles, interviews, press mentions
         if self.google_client:
-            try:
-                print("  - Searching Google for media appearances...")
-                company_name = profile.current_position.company if profile.current_position else None
-                google_data = self.google_client.search_media_appearances(profile.name, company_name)
-                enriched_data["google_results"] = google_data
-                enriched_data["sources_used"].append("google_search")
-                print(f"    ✓ Google: {google_data['total_found']} results found")
-            except Exception as e:
-                print(f"    ✗ Google Search error: {e}")
+            print("  - Searching Google for media appearances...")
+            company_name = profile.current_position.company if profile.current_position else None
+            tasks["google_search"] = asyncio.to_thread(
+                self.google_client.search_media_appearances, profile.name, company_name
+            )
 
         # 5. Podcasts - Find podcast appearances
         if self.podcast_client:
-            try:
-                print("  - Searching for podcast appearances...")
-                podcast_data = self.podcast_client.search_person_appearances(profile.name, max_results=15)
-                enriched_data["podcast_results"] = podcast_data
-                enriched_data["sources_used"].append("podcasts")
-                print(f"    ✓ Podcasts: {podcast_data['total_found']} episodes found")
-            except Exception as e:
-                print(f"    ✗ Podcast search error: {e}")
+            print("  - Searching for podcast appearances...")
+            tasks["podcasts"] = asyncio.to_thread(
+                self.podcast_client.search_person_appearances, profile.name, max_results=15
+            )
+
+        outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        for source, outcome in zip(tasks, outcomes):
+            key, label, unit = self.SOURCE_FIELDS[source]
+            if isinstance(outcome, BaseException):
+                print(f"    ✗ {label} error: {outcome}")
+                continue
+
+            enriched_data[key] = outcome
+            enriched_data["sources_used"].append(source)
+            if unit:
+                print(f"    ✓ {label}: {outcome['total_found']} {unit} found")
+            else:
+                print(f"    ✓ {label}: OK")
 
         return enriched_data
 
+    def filter_relevance(self, profile: FounderProfile, enriched_data: dict, min_relevance_score: int = 50):
+        """Score YouTube, Google and podcast results with a single LLM call per person."""
+        sources = {}
+        for data_key, (source, list_key) in self.FILTERED_RESULTS.items():
+            results = enriched_data.get(data_key, {}).get(list_key)
+            if results:
+                sources[source] = results
+
+        if not sources:
+            return
+
+        position = profile.current_position
+        if position and (position.title or position.company):
+            context = " @ ".join(part for part in (position.title, position.company) if part)
+        else:
+            context = f"Professional content about {profile.name}"
+
+        total = sum(len(results) for results in sources.values())
+        print(f"  - Filtering {total} results with LLM...")
+        filtered = self.relevance_filter.filter_sources(
+            person_name=profile.name,
+            person_context=context,
+            sources=sources,
+            min_relevance_score=min_relevance_score
+        )
+
+        for data_key, (source, list_key) in self.FILTERED_RESULTS.items():
+            if source in filtered:
+                enriched_data[data_key][list_key] = filtered[source]
+                enriched_data[data_key]["total_found"] = len(filtered[source])
+        print(f"    ✓ {sum(len(results) for results in filtered.values())} relevant results kept")
+
+    def enrich_profile(self, profile: FounderProfile, skip_phantombuster: bool = False) -> dict:
+        """Collect enrichment data from all sources."""
+        return asyncio.run(self.enrich_profile_async(profile, skip_phantombuster=skip_phantombuster))
+
     def run(self, input_md: Path, output_md: Path, skip_phantombuster: bool = False) -> str:
         """Run full enrichment pipeline on a single profile."""
 
@@ -133,7 +215,11 @@ class FounderEnrichmentPipeline:
         # 2. Enrich with external data
         enriched_data = self.enrich_profile(profile, skip_phantombuster=skip_phantombuster)
 
-        # 3. Generate enriched markdown via LLM
+        # 3. Filter media results by relevance (one LLM call for all sources)
+        if self.relevance_filter:
+            self.filter_relevance(profile, enriched_data)
+
+        # 4. Generate enriched markdown via LLM
         print("\nGenerating enriched profile via LLM...")
         markdown = generate_enriched_profile(profile, enriched_data, output_md)
 
@@ -149,6 +235,9 @@ class FounderEnrichmentPipeline:
             self.google_client.close()
         if self.podcast_client:
             self.podcast_client.close()
+        if self.relevance_filter:
+            self.relevance_filter.close()
+        self.transport.close()
 
 
 def main():
@@ -157,13 +246,21 @@ def main():
     parser.add_argument("input", type=Path, help="Input LinkedIn .md file")
     parser.add_argument("-o", "--output", type=Path, help="Output enriched .md file")
     parser.add_argument("--no-phantombuster", action="store_true", help="Skip Phantombuster enrichment")
+    parser.add_argument("--llm-filter", action="store_true", help="Filter media results by LLM relevance scoring")
     args = parser.parse_args()
 
+    # Progress from our own modules at INFO; third-party libraries (httpx) stay at WARNING
+    logging.basicConfig(format="  %(message)s")
+    logging.getLogger("scripts").setLevel(logging.INFO)
+
     # Default output path
     if not args.output:
         args.output = args.input.parent / f"{args.input.stem}_enriched.md"
 
-    pipeline = FounderEnrichmentPipeline(use_phantombuster=not args.no_phantombuster)
+    pipeline = FounderEnrichmentPipeline(
+        use_phantombuster=not args.no_phantombuster,
+        use_llm_filter=args.llm_filter
+    )
 
     try:
         pipeline.run(args.input, args.output, skip_phantombuster=args.no_phantombuster)
@@ -3,18 +3,55 @@ LLM-based relevance filter for media content search results.
 Uses OpenAI to verify and categorize search results.
 """
 import os
-import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Optional
-from openai import OpenAI
+import orjson
 
-# Load env
-env_file = Path(__file__).parent.parent.parent.parent / ".env.local"
-if env_file.exists():
-    for line in env_file.read_text().splitlines():
-        if line and not line.startswith('#') and '=' in line:
-            key, value = line.split('=', 1)
-            os.environ.setdefault(key.strip(), value.strip())
+# The SDK is slow to import: importing this module only checks it is installed
+# (callers guard on ImportError), and the first RelevanceFilter imports it
+if find_spec("openai") is None:
+    raise ImportError("openai is required for relevance filtering (pip install openai)")
+
+from scripts.config import CACHE_DIR
+from scripts.scrapers.cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = CACHE_DIR / "relevance_cache.json"
+
+# Evaluation prompt; only the person and the formatted results change per call
+PROMPT_TEMPLATE = """Tu es un assistant qui évalue la pertinence de résultats de recherche pour un profil professionnel.
+
+PERSONNE RECHERCHÉE:
+- Nom: {name}
+- Contexte: {context}
+
+RÉSULTATS À ÉVALUER:
+{results}
+
+Pour chaque résultat, détermine:
+1. relevance_score (0-100): Pertinence pour le profil PROFESSIONNEL de cette personne
+   - 90-100: Interview directe, podcast où la personne est invitée, talk/conférence
+   - 70-89: Contenu créé par la personne (sa chaîne YouTube, son blog)
+   - 50-69: Mention significative dans un contenu pertinent
+   - 20-49: Mention légère ou contexte peu clair
+   - 0-19: Non pertinent (homonyme, contenu personnel non-pro, spam)
+
+2. category: Une des catégories suivantes:
+   - "interview": Interview sur une autre chaîne/média
+   - "own_content": Contenu créé par la personne
+   - "podcast": Apparition dans un podcast
+   - "talk": Conférence, keynote, présentation
+   - "mention": Mentionné dans le contenu
+   - "article": Article écrit par ou sur la personne
+   - "irrelevant": Non pertinent
+
+3. reason: Courte explication (max 10 mots)
+
+Renvoie une évaluation par résultat, avec son identifiant entre crochets comme id."""
 
 
 class RelevanceFilter:
@@ -33,13 +70,57 @@ class RelevanceFilter:
         "irrelevant"      # Non pertinent (contenu perso, homonyme, etc.)
     ]
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Cached decisions are reused for a week, keeping at most this many entries
+    CACHE_TTL = 7 * 86400
+    CACHE_MAX_ENTRIES = 50_000
+
+    # Part of every cache key: bump when the prompt or scoring scale changes
+    PROMPT_VERSION = "3"
+
+    # Structured output: the API guarantees replies match this schema
+    RESPONSE_FORMAT = {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "relevance_evaluations",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "evaluations": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "id": {"type": "string"},
+                                "relevance_score": {"type": "integer"},
+                                "category": {"type": "string", "enum": CATEGORIES},
+                                "reason": {"type": "string"}
+                            },
+                            "required": ["id", "relevance_score", "category", "reason"],
+                            "additionalProperties": False
+                        }
+                    }
+                },
+                "required": ["evaluations"],
+                "additionalProperties": False
+            }
+        }
+    }
+
+    # Concurrent LLM calls in filter_many
+    MAX_CONCURRENT_CALLS = 8
+
+    def __init__(self, api_key: Optional[str] = None, cache_path: Optional[Path] = CACHE_PATH):
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY required for relevance filtering")
 
+        from openai import OpenAI
         self.client = OpenAI(api_key=self.api_key)
 
+        # Relevance decisions keyed by (prompt version, person, result id), persisted on close()
+        self.cache = ResponseCache(cache_path, self.CACHE_TTL, self.CACHE_MAX_ENTRIES)
+
     def filter_results(
         self,
         person_name: str,
@@ -59,100 +140,163 @@ class RelevanceFilter:
         Returns:
             Filtered list with added 'relevance_score' and 'category' fields
         """
-        if not results:
-            return []
-
-        # Prepare results for LLM
-        results_text = self._format_results_for_prompt(results)
-
-        prompt = f"""Tu es un assistant qui évalue la pertinence de résultats de recherche pour un profil professionnel.
-
-PERSONNE RECHERCHÉE:
-- Nom: {person_name}
-- Contexte: {person_context}
+        return self.filter_sources(
+            person_name,
+            person_context,
+            {"r": results},
+            min_relevance_score=min_relevance_score
+        )["r"]
+
+    def filter_sources(
+        self,
+        person_name: str,
+        person_context: str,
+        sources: dict[str, list[dict]],
+        min_relevance_score: int = 50
+    ) -> dict[str, list[dict]]:
+        """
+        Filter results from several sources with a single LLM call.
 
-RÉSULTATS À ÉVALUER:
-{results_text}
+        Decisions already in the cache are reused; only unseen results are sent to the LLM.
 
-Pour chaque résultat, détermine:
-1. relevance_score (0-100): Pertinence pour le profil PROFESSIONNEL de cette personne
-   - 90-100: Interview directe, podcast où la personne est invitée, talk/conférence
-   - 70-89: Contenu créé par la personne (sa chaîne YouTube, son blog)
-   - 50-69: Mention significative dans un contenu pertinent
-   - 20-49: Mention légère ou contexte peu clair
-   - 0-19: Non pertinent (homonyme, contenu personnel non-pro, spam)
+        Args:
+            person_name: Full name of the person
+            person_context: Brief description (job title, company, domain)
+            sources: Source name -> list of search results (e.g. {"youtube": [...], "google": [...]})
+            min_relevance_score: Minimum score (0-100) to keep a result
 
-2. category: Une des catégories suivantes:
-   - "interview": Interview sur une autre chaîne/média
-   - "own_content": Contenu créé par la personne
-   - "podcast": Apparition dans un podcast
-   - "talk": Conférence, keynote, présentation
-   - "mention": Mentionné dans le contenu
-   - "article": Article écrit par ou sur la personne
-   - "irrelevant": Non pertinent
+        Returns:
+            Source name -> filtered list with added 'relevance_score' and 'category' fields,
+            sorted by relevance
+        """
+        items = [
+            (f"{source}:{i}", result)
+            for source, results in sources.items()
+            for i, result in enumerate(results)
+        ]
+
+        # Reuse cached decisions, only send unseen results to the LLM
+        decisions = {}
+        misses = []
+        for item_id, result in items:
+            cached = self.cache.get(self._cache_key(person_name, result))
+            if cached is not None:
+                decisions[item_id] = cached
+            else:
+                misses.append((item_id, result))
+
+        if misses:
+            prompt = PROMPT_TEMPLATE.format(
+                name=person_name,
+                context=person_context,
+                results=self._format_results_for_prompt(misses)
+            )
 
-3. reason: Courte explication (max 10 mots)
+            try:
+                response = self.client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.1,
+                    # ~40 tokens per evaluation, plus the JSON envelope
+                    max_tokens=min(4000, 200 + 50 * len(misses)),
+                    response_format=self.RESPONSE_FORMAT
+                )
+
+                # Structured output always matches the schema unless it was cut off
+                choice = response.choices[0]
+                if choice.finish_reason == "length":
+                    raise ValueError("response truncated at max_tokens")
+                evaluations = orjson.loads(choice.message.content)["evaluations"]
+            except Exception as e:
+                logger.warning("LLM filtering error: %s", e)
+                # Fallback: return all results without filtering
+                return sources
+
+            pending = dict(misses)
+            for eval_item in evaluations:
+                item_id = str(eval_item.get("id", ""))
+                if item_id not in pending:
+                    continue
+
+                decision = {
+                    "relevance_score": eval_item["relevance_score"],
+                    "category": eval_item["category"],
+                    "reason": eval_item.get("reason", "")
+                }
+                decisions[item_id] = decision
+                self.cache.put(self._cache_key(person_name, pending[item_id]), decision)
+
+        # Merge decisions with original results
+        filtered = {source: [] for source in sources}
+        for item_id, result in items:
+            decision = decisions.get(item_id)
+            if decision is None or decision["relevance_score"] < min_relevance_score:
+                continue
+
+            result = result.copy()
+            result["relevance_score"] = decision["relevance_score"]
+            result["category"] = decision["category"]
+            result["relevance_reason"] = decision["reason"]
+            filtered[item_id.rsplit(":", 1)[0]].append(result)
+
+        # Sort by relevance score
+        for results in filtered.values():
+            results.sort(key=lambda x: x["relevance_score"], reverse=True)
+        return filtered
+
+    def filter_many(
+        self,
+        people: list[tuple[str, str, dict[str, list[dict]]]],
+        min_relevance_score: int = 50
+    ) -> list[dict[str, list[dict]]]:
+        """
+        Run filter_sources for several people concurrently.
 
-Réponds UNIQUEMENT en JSON valide avec ce format:
-{{
-  "evaluations": [
-    {{"index": 0, "relevance_score": 85, "category": "interview", "reason": "Interview directe sur chaîne tech"}},
-    {{"index": 1, "relevance_score": 15, "category": "irrelevant", "reason": "Vidéo personnelle non professionnelle"}}
-  ]
-}}"""
-
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "Tu réponds uniquement en JSON valide."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                max_tokens=2000
-            )
+        Each person is still one LLM call (prompts stay per person), but up to
+        MAX_CONCURRENT_CALLS calls are in flight at once.
 
-            content = response.choices[0].message.content.strip()
-            # Clean potential markdown code blocks
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
+        Args:
+            people: (person_name, person_context, sources) tuples
+            min_relevance_score: Minimum score (0-100) to keep a result
 
-            evaluations = json.loads(content)["evaluations"]
+        Returns:
+            filter_sources results, in the same order as `people`
+        """
+        if not people:
+            return []
 
-            # Merge evaluations with original results
-            filtered_results = []
-            for eval_item in evaluations:
-                idx = eval_item["index"]
-                if idx < len(results):
-                    result = results[idx].copy()
-                    result["relevance_score"] = eval_item["relevance_score"]
-                    result["category"] = eval_item["category"]
-                    result["relevance_reason"] = eval_item.get("reason", "")
-
-                    if result["relevance_score"] >= min_relevance_score:
-                        filtered_results.append(result)
-
-            # Sort by relevance score
-            filtered_results.sort(key=lambda x: x["relevance_score"], reverse=True)
-            return filtered_results
-
-        except Exception as e:
-            print(f"  [!] LLM filtering error: {e}")
-            # Fallback: return all results without filtering
-            return results
-
-    def _format_results_for_prompt(self, results: list[dict]) -> str:
-        """Format results list for LLM prompt."""
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_CALLS, len(people))) as executor:
+            return list(executor.map(
+                lambda person: self.filter_sources(*person, min_relevance_score=min_relevance_score),
+                people
+            ))
+
+    @classmethod
+    def _cache_key(cls, person_name: str, result: dict) -> str:
+        """Cache key for a (person, result) relevance decision."""
+        # Platform ids are stable across URL variants and title edits
+        if result.get("video_id"):
+            result_id = f"youtube:{result['video_id']}"
+        elif result.get("episode_id"):
+            result_id = f"listennotes:{result['episode_id']}"
+        else:
+            url = result.get("url") or result.get("listennotes_url") or ""
+            result_id = f"{url}|{result.get('title', '')}"
+        return f"{cls.PROMPT_VERSION}|{person_name}|{result_id}"
+
+    def close(self):
+        self.cache.save()
+
+    def _format_results_for_prompt(self, items: list[tuple[str, dict]]) -> str:
+        """Format (id, result) pairs for LLM prompt."""
         lines = []
-        for i, r in enumerate(results):
+        for item_id, r in items:
             title = r.get("title", "N/A")
-            desc = r.get("description", "")[:200] if r.get("description") else "N/A"
-            channel = r.get("channel_title") or r.get("source") or "N/A"
-            url = r.get("url", "N/A")
+            desc = (r.get("description") or r.get("snippet") or "")[:200] or "N/A"
+            channel = r.get("channel_title") or r.get("source") or r.get("podcast_name") or "N/A"
+            url = r.get("url") or r.get("listennotes_url") or "N/A"
 
-            lines.append(f"[{i}] Titre: {title}")
+            lines.append(f"[{item_id}] Titre: {title}")
             lines.append(f"    Source/Chaîne: {channel}")
             lines.append(f"    Description: {desc}")
             lines.append(f"    URL: {url}")
@@ -218,3 +362,5 @@ if __name__ == "__main__":
         print(f"      {r['title']}")
         print(f"      Reason: {r.get('relevance_reason', 'N/A')}")
         print()
+
+    filter.close()
@@ -3,10 +3,16 @@ Pydantic models for Founder profiles.
 """
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class Position(BaseModel):
+class _Model(BaseModel):
+    """Base for the profile models: plain data holders, validated on construction only."""
+    # Build validators on first use instead of at import; drop unknown fields
+    model_config = ConfigDict(defer_build=True, extra='ignore', validate_assignment=False)
+
+
+class Position(_Model):
     """Current or past position."""
     title: Optional[str] = None
     company: Optional[str] = None
@@ -17,7 +23,7 @@ class Position(BaseModel):
     end_date: Optional[str] = None
 
 
-class Education(BaseModel):
+class Education(_Model):
     """Education entry."""
     school: Optional[str] = None
     degree: Optional[str] = None
@@ -25,7 +31,7 @@ class Education(BaseModel):
     dates: Optional[str] = None
 
 
-class LinkedInActivity(BaseModel):
+class LinkedInActivity(_Model):
     """LinkedIn post or article."""
     type: str  # post, article
     content: Optional[str] = None
@@ -35,7 +41,7 @@ class LinkedInActivity(BaseModel):
     url: Optional[str] = None
 
 
-class MediaMention(BaseModel):
+class MediaMention(_Model):
     """Press or media mention."""
     title: str
     source: Optional[str] = None
@@ -44,7 +50,7 @@ class MediaMention(BaseModel):
     snippet: Optional[str] = None
 
 
-class VideoAppearance(BaseModel):
+class VideoAppearance(_Model):
     """YouTube/podcast appearance."""
     title: str
     channel: Optional[str] = None
@@ -53,7 +59,7 @@ class VideoAppearance(BaseModel):
     description: Optional[str] = None
 
 
-class FounderProfile(BaseModel):
+class FounderProfile(_Model):
     """Complete founder profile."""
     # Identity
     id: str
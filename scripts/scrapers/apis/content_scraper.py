@@ -3,14 +3,25 @@ Combined content scraper for founders.
 
 Pipeline: Exa (search) → Jina (read content) → Structured output
 """
-import json
+import logging
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+import orjson
+
+from scripts.config import CACHE_DIR
+from scripts.scrapers.transport import shared_transport
+from scripts.scrapers.urls import safe_slug
+
 from .exa import ExaClient
 from .jina import JinaReader
 
+logger = logging.getLogger(__name__)
+
+# Exa result category -> by_category key
+_CATEGORY_KEY = {"blog": "blogs", "article": "articles", "podcast": "podcasts", "video": "videos"}
+
 
 class FounderContentScraper:
     """
@@ -22,8 +33,10 @@ class FounderContentScraper:
     """
 
     def __init__(self):
-        self.exa = ExaClient()
-        self.jina = JinaReader()
+        # One connection pool (and TLS setup) for both clients
+        self.transport = shared_transport()
+        self.exa = ExaClient(transport=self.transport)
+        self.jina = JinaReader(transport=self.transport)
 
     def scrape(
         self,
@@ -66,36 +79,44 @@ class FounderContentScraper:
 
         # Step 2: Read content with Jina
         contents = []
+        by_category = {"blogs": [], "articles": [], "podcasts": [], "videos": []}
         if read_content and search_results['results']:
             print(f"\n[2/2] Reading content with Jina Reader...")
 
-            for i, result in enumerate(search_results['results']):
-                url = result.get('url')
-                if not url:
-                    continue
-
-                print(f"\n  [{i+1}/{len(search_results['results'])}] {result['title'][:50]}...")
-
-                content = self.jina.read_url(url)
+            # Reads run concurrently and are reported as they complete;
+            # contents keep the search order
+            to_read = [r for r in search_results['results'] if r.get('url')]
+            contents = [None] * len(to_read)
 
+            for i, content in self.jina.iter_read([r['url'] for r in to_read]):
+                result = to_read[i]
                 if content['success']:
-                    print(f"    ✓ {content['word_count']} words")
-                    contents.append({
+                    logger.info("  [%d/%d] %s... ✓ %d words",
+                                i + 1, len(to_read), result['title'][:50], content['word_count'])
+                    contents[i] = {
                         **result,
                         "content": content['content'],
                         "word_count": content['word_count'],
                         "scraped": True
-                    })
+                    }
                 else:
-                    print(f"    ✗ Failed: {content['error'][:40]}")
-                    contents.append({
+                    logger.info("  [%d/%d] %s... ✗ Failed: %s",
+                                i + 1, len(to_read), result['title'][:50], content['error'][:40])
+                    contents[i] = {
                         **result,
                         "content": None,
                         "error": content['error'],
                         "scraped": False
-                    })
+                    }
+
+            for content in contents:
+                key = _CATEGORY_KEY.get(content.get('category'))
+                if key:
+                    by_category[key].append(content)
         else:
             contents = search_results['results']
+            # Exa already bucketed the raw results
+            by_category = {key: search_results[key] for key in by_category}
 
         # Build final output
         output = {
@@ -104,14 +125,9 @@ class FounderContentScraper:
             "scraped_at": datetime.now().isoformat(),
             "query": search_results['query'],
             "total_found": len(contents),
-            "total_scraped": len([c for c in contents if c.get('scraped')]),
+            "total_scraped": sum(1 for c in contents if c.get('scraped')),
             "contents": contents,
-            "by_category": {
-                "blogs": [c for c in contents if c.get('category') == 'blog'],
-                "articles": [c for c in contents if c.get('category') == 'article'],
-                "podcasts": [c for c in contents if c.get('category') == 'podcast'],
-                "videos": [c for c in contents if c.get('category') == 'video']
-            }
+            "by_category": by_category
         }
 
         print(f"\n{'='*60}")
@@ -140,18 +156,27 @@ class FounderContentScraper:
             num_results=num_results
         )
 
+        return self.save(data, output_dir)
+
+    def save(self, data: dict, output_dir: Optional[Path] = None) -> Path:
+        """
+        Save scrape() output to a timestamped JSON file.
+
+        Returns:
+            Path to saved JSON file
+        """
         # Output path
         if output_dir is None:
-            output_dir = Path(__file__).parent.parent.parent.parent / "data" / "cache"
+            output_dir = CACHE_DIR
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate filename
-        safe_name = founder_name.lower().replace(' ', '_')
+        safe_name = safe_slug(data['founder_name'])
         filename = f"{safe_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         output_path = output_dir / filename
 
-        # Save
-        output_path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+        # Save (compact JSON)
+        output_path.write_bytes(orjson.dumps(data))
         print(f"Saved to: {output_path}")
 
         return output_path
@@ -159,47 +184,46 @@ class FounderContentScraper:
     def close(self):
         self.exa.close()
         self.jina.close()
+        self.transport.close()
 
 
 # CLI
 if __name__ == "__main__":
-    import sys
-
-    if len(sys.argv) < 2:
-        print("Usage: python content_scraper.py <founder_name> [company_name] [--num=10] [--no-content]")
-        print("")
-        print("Examples:")
-        print("  python content_scraper.py 'Elon Musk' 'Tesla'")
-        print("  python content_scraper.py 'Sam Altman' 'OpenAI' --num=5")
-        print("  python content_scraper.py 'Naval Ravikant' --no-content")
-        sys.exit(1)
-
-    founder_name = sys.argv[1]
-    company_name = None
-    num_results = 10
-    read_content = True
-
-    # Parse args
-    for arg in sys.argv[2:]:
-        if arg.startswith('--num='):
-            num_results = int(arg.split('=')[1])
-        elif arg == '--no-content':
-            read_content = False
-        elif not arg.startswith('--'):
-            company_name = arg
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Find and read articles, blogs and podcasts about a founder (Exa + Jina)",
+        epilog="""Examples:
+  python content_scraper.py 'Elon Musk' 'Tesla'
+  python content_scraper.py 'Sam Altman' 'OpenAI' --num=5
+  python content_scraper.py 'Naval Ravikant' --no-content""",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("founder_name", help="Full name of the founder")
+    parser.add_argument("company_name", nargs="?", help="Company name (optional)")
+    parser.add_argument("--num", type=int, default=10, help="Max URLs to find")
+    parser.add_argument("--no-content", action="store_true", help="Only search, don't read pages with Jina")
+
+    args = parser.parse_args()
+
+    # Per-URL progress is logged at INFO (this module runs as __main__ here)
+    logging.basicConfig(format="%(message)s")
+    for name in ("scripts", __name__):
+        logging.getLogger(name).setLevel(logging.INFO)
 
     scraper = FounderContentScraper()
 
     try:
-        output_path = scraper.scrape_and_save(
-            founder_name=founder_name,
-            company_name=company_name,
-            num_results=num_results
+        # Keep the scraped data for the summary instead of re-reading the file
+        data = scraper.scrape(
+            founder_name=args.founder_name,
+            company_name=args.company_name,
+            num_results=args.num,
+            read_content=not args.no_content
         )
+        scraper.save(data)
 
         # Show summary
-        data = json.loads(output_path.read_text())
-
         print("\n" + "="*60)
         print("SUMMARY")
         print("="*60)
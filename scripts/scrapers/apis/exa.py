@@ -7,14 +7,36 @@ import os
 from pathlib import Path
 from typing import Optional
 import httpx
+import orjson
 
-# Load env
-env_file = Path(__file__).parent.parent.parent.parent / ".env.local"
-if env_file.exists():
-    for line in env_file.read_text().splitlines():
-        if line and not line.startswith('#') and '=' in line:
-            key, value = line.split('=', 1)
-            os.environ.setdefault(key.strip(), value.strip())
+from scripts.config import CACHE_DIR
+from scripts.scrapers.cache import ResponseCache
+from scripts.scrapers.rate_limit import TokenBucket
+from scripts.scrapers.transport import shared_transport
+
+CACHE_PATH = CACHE_DIR / "exa_cache.json"
+
+# search_founder_content query, with and without the company
+_QUERY_WITH_COMPANY = "Blog posts or articles written by {name} founder of {company}, or interviews and podcasts featuring {name}"
+_QUERY = "Blog posts or articles written by {name}, or interviews and podcasts featuring {name}"
+
+# Social networks are left out of the search results
+_EXCLUDE_DOMAINS = ("linkedin.com", "facebook.com", "twitter.com", "x.com", "instagram.com")
+
+
+def _categorize(url: str) -> str:
+    """Category of an Exa result from its URL (default: article)."""
+    # Plain substring tests on the lowercased URL: faster than a regex here.
+    # Order matters (a podcast on a blog domain is a podcast); "podcast"
+    # also covers apple.com/podcast.
+    url = url.lower()
+    if "podcast" in url or "spotify" in url:
+        return "podcast"
+    if "youtube.com" in url or "youtu.be" in url:
+        return "video"
+    if "medium.com" in url or "substack" in url or "blog" in url:
+        return "blog"
+    return "article"
 
 
 class ExaClient:
@@ -27,19 +49,52 @@ class ExaClient:
 
     BASE_URL = "https://api.exa.ai"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Requests per second (token bucket rate, burst)
+    RATE_LIMIT = (5, 5)
+
+    # Search responses are reused for a day
+    CACHE_TTL = 86400
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        cache_path: Optional[Path] = CACHE_PATH
+    ):
         self.api_key = api_key or os.environ.get("EXA_API_KEY")
         if not self.api_key:
             raise ValueError("EXA_API_KEY required")
 
+        # A shared transport belongs to the caller, who closes it. Otherwise keep
+        # a pool of our own so repeated searches reuse the TLS connection.
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = shared_transport(max_connections=20, max_keepalive_connections=10)
+        self.rate_limiter = TokenBucket(*self.RATE_LIMIT)
         self.client = httpx.Client(
-            timeout=60.0,
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            transport=transport,
             headers={
                 "x-api-key": self.api_key,
                 "Content-Type": "application/json"
-            }
+            },
+            event_hooks={"request": [self.rate_limiter]}
         )
 
+        # Search responses keyed by request payload, persisted on close()
+        self.cache = ResponseCache(cache_path, self.CACHE_TTL)
+
+    def _post(self, endpoint: str, payload: dict) -> dict:
+        """POST to the API and return the JSON response (cached)."""
+        def fetch():
+            resp = self.client.post(f"{self.BASE_URL}{endpoint}", json=payload)
+            resp.raise_for_status()
+            # orjson parses the bytes directly (text bodies can be large with contents)
+            return orjson.loads(resp.content)
+
+        key = f"{endpoint}|{orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode()}"
+        return self.cache.get_or_fetch(key, fetch)
+
     def search_founder_content(
         self,
         founder_name: str,
@@ -61,20 +116,14 @@ class ExaClient:
         """
         # Build search query
         if company_name:
-            query = f"Blog posts or articles written by {founder_name} founder of {company_name}, or interviews and podcasts featuring {founder_name}"
+            query = _QUERY_WITH_COMPANY.format(name=founder_name, company=company_name)
         else:
-            query = f"Blog posts or articles written by {founder_name}, or interviews and podcasts featuring {founder_name}"
+            query = _QUERY.format(name=founder_name)
 
         payload = {
             "query": query,
             "numResults": num_results,
-            "excludeDomains": [
-                "linkedin.com",
-                "facebook.com",
-                "twitter.com",
-                "x.com",
-                "instagram.com"
-            ],
+            "excludeDomains": _EXCLUDE_DOMAINS,
             "type": "auto",
             "useAutoprompt": True
         }
@@ -88,12 +137,11 @@ class ExaClient:
         endpoint = "/search"
 
         try:
-            resp = self.client.post(f"{self.BASE_URL}{endpoint}", json=payload)
-            resp.raise_for_status()
-            data = resp.json()
+            data = self._post(endpoint, payload)
 
-            # Process results
+            # Process results, bucketing by category as we go
             results = []
+            buckets = {"blog": [], "article": [], "podcast": [], "video": []}
             for item in data.get("results", []):
                 result = {
                     "title": item.get("title"),
@@ -103,31 +151,24 @@ class ExaClient:
                     "score": item.get("score"),
                 }
 
-                # Categorize by URL/content
-                url = item.get("url", "").lower()
-                if "podcast" in url or "spotify" in url or "apple.com/podcast" in url:
-                    result["category"] = "podcast"
-                elif "youtube.com" in url or "youtu.be" in url:
-                    result["category"] = "video"
-                elif "medium.com" in url or "substack" in url or "blog" in url:
-                    result["category"] = "blog"
-                else:
-                    result["category"] = "article"
+                # Categorize by URL
+                result["category"] = _categorize(item.get("url", ""))
 
                 # Add content if fetched
                 if include_contents and item.get("text"):
                     result["content"] = item.get("text")
 
                 results.append(result)
+                buckets[result["category"]].append(result)
 
             return {
                 "query": query,
                 "results": results,
                 "total_found": len(results),
-                "blogs": [r for r in results if r["category"] == "blog"],
-                "articles": [r for r in results if r["category"] == "article"],
-                "podcasts": [r for r in results if r["category"] == "podcast"],
-                "videos": [r for r in results if r["category"] == "video"]
+                "blogs": buckets["blog"],
+                "articles": buckets["article"],
+                "podcasts": buckets["podcast"],
+                "videos": buckets["video"]
             }
 
         except httpx.HTTPStatusError as e:
@@ -156,7 +197,9 @@ class ExaClient:
         )
 
     def close(self):
-        self.client.close()
+        self.cache.save()
+        if self._owns_transport:
+            self.client.close()
 
 
 # CLI for testing
@@ -165,8 +208,8 @@ if __name__ == "__main__":
     import json
 
     if len(sys.argv) < 2:
-        print("Usage: python exa.py <founder_name> [company_name]")
-        print("Example: python exa.py 'Ilyas Bakouch' 'Mila'")
+        print("Usage: python -m scripts.scrapers.apis.exa <founder_name> [company_name]")
+        print("Example: python -m scripts.scrapers.apis.exa 'Ilyas Bakouch' 'Mila'")
         sys.exit(1)
 
     founder_name = sys.argv[1]
@@ -4,25 +4,78 @@ Unified founder content scraper.
 Combines all sources: Exa.ai + Jina, YouTube, Google Search
 Outputs a single Markdown file with all findings.
 """
-import os
-import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
-# Load env
-env_file = Path(__file__).parent.parent.parent.parent / ".env.local"
-if env_file.exists():
-    for line in env_file.read_text().splitlines():
-        if line and not line.startswith('#') and '=' in line:
-            key, value = line.split('=', 1)
-            os.environ.setdefault(key.strip(), value.strip())
+import orjson
+
+from scripts.config import OUTPUT_DIR
+from scripts.scrapers.transport import shared_transport
+from scripts.scrapers.urls import safe_slug, url_key
 
 from .exa import ExaClient
 from .jina import JinaReader
 from .youtube import YouTubeClient
 from .google_search import GoogleSearchClient
 
+logger = logging.getLogger(__name__)
+
+# Markdown report templates (str.format)
+MARKDOWN_HEADER = """# {founder}
+{company_line}
+
+*Scraped: {scraped_date}*
+
+---
+
+## 📊 Summary
+
+| Source | Results |
+|--------|---------|
+| Articles & Blogs (Exa) | {exa_total} |
+| YouTube Videos | {youtube_total} |
+| Press & Mentions (Google) | {google_total} |
+
+---
+
+## 📚 Articles & Blog Posts
+
+"""
+
+EXA_ITEM = "### [{title}]({url})\n{date_line}- Category: {category}\n\n"
+
+YOUTUBE_ITEM = "- **[{title}]({url})**\n  - Channel: {channel}\n{date_line}\n"
+
+GOOGLE_ITEM = "- **[{title}]({url})**\n  - Source: {source}\n{snippet_line}\n"
+
+# Social media and video platforms, not worth reading with Jina (subdomains included)
+_SKIP_HOSTS = frozenset({
+    "youtube.com", "youtu.be", "twitter.com", "x.com",
+    "facebook.com", "linkedin.com", "instagram.com"
+})
+
+
+def _strip_bounds(text: str) -> tuple[int, int]:
+    """(start, end) such that text[start:end] == text.strip(), without copying text."""
+    start, end = 0, len(text)
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _is_skipped_host(host: str) -> bool:
+    """True if host or one of its parent domains is in _SKIP_HOSTS."""
+    while host:
+        if host in _SKIP_HOSTS:
+            return True
+        host = host.partition(".")[2]
+    return False
+
 
 class FounderScraper:
     """
@@ -35,21 +88,30 @@ class FounderScraper:
     - Google: Press mentions, interviews
     """
 
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
+        # Directories already created by scrape_and_save
+        self._known_dirs: set[Path] = set()
+
+        # One connection pool for all sources (kept alive across founders)
+        self.transport = shared_transport()
+
+        # Response caches in data/cache (cache_path=None disables them)
+        cache = {} if use_cache else {"cache_path": None}
+
         # Initialize clients
-        self.exa = ExaClient()
-        self.jina = JinaReader()
+        self.exa = ExaClient(transport=self.transport, **cache)
+        self.jina = JinaReader(transport=self.transport, **cache)
 
         self.youtube = None
         self.google = None
 
         try:
-            self.youtube = YouTubeClient()
+            self.youtube = YouTubeClient(transport=self.transport, **cache)
         except ValueError:
             print("[!] YouTube API not configured")
 
         try:
-            self.google = GoogleSearchClient()
+            self.google = GoogleSearchClient(transport=self.transport, **cache)
         except ValueError:
             print("[!] Google Search API not configured")
 
@@ -81,101 +143,119 @@ class FounderScraper:
             "content_fetched": []
         }
 
-        # 1. Exa.ai - Semantic search for articles/blogs
-        print("[1/3] 📚 Exa.ai - Articles & Blogs...")
-        try:
-            exa_results = self.exa.search_founder_content(
+        # The three searches are independent: run them in parallel, then report
+        # each one in order as before
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            exa_future = pool.submit(
+                self.exa.search_founder_content,
                 founder_name=founder_name,
                 company_name=company_name,
                 num_results=max_results_per_source
             )
-            results["exa"]["results"] = exa_results.get("results", [])
-            results["exa"]["total"] = exa_results.get("total_found", 0)
-            print(f"   ✓ Found {results['exa']['total']} results")
-        except Exception as e:
-            print(f"   ✗ Error: {e}")
-
-        # 2. YouTube - Video content
-        if self.youtube:
-            print("\n[2/3] 🎬 YouTube - Videos...")
+            yt_future = pool.submit(
+                self.youtube.search_person_content,
+                person_name=founder_name,
+                max_results=max_results_per_source
+            ) if self.youtube else None
+            google_future = pool.submit(
+                self.google.search_media_appearances,
+                person_name=founder_name,
+                company_name=company_name
+            ) if self.google else None
+
+            # 1. Exa.ai - Semantic search for articles/blogs
+            print("[1/3] 📚 Exa.ai - Articles & Blogs...")
             try:
-                yt_results = self.youtube.search_person_content(
-                    person_name=founder_name,
-                    max_results=max_results_per_source
-                )
-                results["youtube"]["results"] = yt_results.get("all_videos", [])
-                results["youtube"]["total"] = yt_results.get("total_found", 0)
-                print(f"   ✓ Found {results['youtube']['total']} videos")
+                exa_results = exa_future.result()
+                results["exa"]["results"] = exa_results.get("results", [])
+                results["exa"]["total"] = exa_results.get("total_found", 0)
+                print(f"   ✓ Found {results['exa']['total']} results")
             except Exception as e:
                 print(f"   ✗ Error: {e}")
-        else:
-            print("\n[2/3] 🎬 YouTube - Skipped (not configured)")
 
-        # 3. Google Search - Press & mentions
-        if self.google:
-            print("\n[3/3] 🔎 Google - Press & Mentions...")
-            try:
-                google_results = self.google.search_media_appearances(
-                    person_name=founder_name,
-                    company_name=company_name
-                )
-                results["google"]["results"] = google_results.get("all_results", [])
-                results["google"]["total"] = google_results.get("total_found", 0)
-                print(f"   ✓ Found {results['google']['total']} results")
-            except Exception as e:
-                print(f"   ✗ Error: {e}")
-        else:
-            print("\n[3/3] 🔎 Google - Skipped (not configured)")
+            # 2. YouTube - Video content
+            if yt_future:
+                print("\n[2/3] 🎬 YouTube - Videos...")
+                try:
+                    yt_results = yt_future.result()
+                    results["youtube"]["results"] = yt_results.get("all_videos", [])
+                    results["youtube"]["total"] = yt_results.get("total_found", 0)
+                    print(f"   ✓ Found {results['youtube']['total']} videos")
+                except Exception as e:
+                    print(f"   ✗ Error: {e}")
+            else:
+                print("\n[2/3] 🎬 YouTube - Skipped (not configured)")
+
+            # 3. Google Search - Press & mentions
+            if google_future:
+                print("\n[3/3] 🔎 Google - Press & Mentions...")
+                try:
+                    google_results = google_future.result()
+                    results["google"]["results"] = google_results.get("all_results", [])
+                    results["google"]["total"] = google_results.get("total_found", 0)
+                    print(f"   ✓ Found {results['google']['total']} results")
+                except Exception as e:
+                    print(f"   ✗ Error: {e}")
+            else:
+                print("\n[3/3] 🔎 Google - Skipped (not configured)")
 
         # 4. Fetch full content with Jina (from ALL sources)
         if fetch_content:
             print(f"\n[+] 📖 Fetching full content with Jina Reader...")
 
-            # Collect URLs from Exa and Google (skip YouTube - it's video)
+            # Collect URLs from Exa and Google (skip YouTube - it's video),
+            # deduplicated on normalized URLs so variants are only read once
             urls_to_fetch = []
-            seen_urls = set()
+            seen_keys = set()
 
             # Exa URLs
             for r in results["exa"]["results"]:
                 url = r.get("url")
-                if url and url not in seen_urls:
-                    urls_to_fetch.append({"url": url, "source": "exa", "title": r.get("title", "")})
-                    seen_urls.add(url)
+                if url:
+                    key = url_key(url)
+                    if key not in seen_keys:
+                        urls_to_fetch.append({"url": url, "source": "exa", "title": r.get("title", "")})
+                        seen_keys.add(key)
 
             # Google URLs
             for r in results["google"]["results"]:
                 url = r.get("url")
-                if url and url not in seen_urls:
+                if url:
+                    key = url_key(url)
                     # Skip social media and video platforms
-                    skip_domains = ["youtube.com", "twitter.com", "x.com", "facebook.com", "linkedin.com", "instagram.com"]
-                    if not any(domain in url.lower() for domain in skip_domains):
+                    if key not in seen_keys and not _is_skipped_host(key[0]):
                         urls_to_fetch.append({"url": url, "source": "google", "title": r.get("title", "")})
-                        seen_urls.add(url)
+                        seen_keys.add(key)
 
             # Limit total URLs to fetch
             urls_to_fetch = urls_to_fetch[:max_results_per_source * 2]
 
             print(f"   Scraping {len(urls_to_fetch)} URLs (Exa + Google)...\n")
 
-            for i, item in enumerate(urls_to_fetch):
+            # Reads run concurrently and are reported as they complete;
+            # content_fetched keeps the urls_to_fetch order
+            fetched = [None] * len(urls_to_fetch)
+
+            for i, content in self.jina.iter_read([item["url"] for item in urls_to_fetch]):
+                item = urls_to_fetch[i]
                 url = item["url"]
                 source = item["source"]
-                print(f"   [{i+1}/{len(urls_to_fetch)}] [{source.upper()}] {url[:50]}...")
-                try:
-                    content = self.jina.read_url(url)
-                    if content["success"]:
-                        results["content_fetched"].append({
-                            "url": url,
-                            "source": source,
-                            "title": content.get("title", "") or item.get("title", ""),
-                            "content": content.get("content", ""),
-                            "word_count": content.get("word_count", 0)
-                        })
-                        print(f"       ✓ {content['word_count']} words")
-                    else:
-                        print(f"       ✗ Failed: {content.get('error', 'Unknown')[:30]}")
-                except Exception as e:
-                    print(f"       ✗ Error: {e}")
+                if content["success"]:
+                    fetched[i] = {
+                        "url": url,
+                        "source": source,
+                        "title": content.get("title", "") or item.get("title", ""),
+                        "content": content.get("content", ""),
+                        "word_count": content.get("word_count", 0)
+                    }
+                    logger.info("   [%d/%d] [%s] %s... ✓ %d words",
+                                i + 1, len(urls_to_fetch), source.upper(), url[:50], content["word_count"])
+                else:
+                    logger.info("   [%d/%d] [%s] %s... ✗ Failed: %s",
+                                i + 1, len(urls_to_fetch), source.upper(), url[:50],
+                                content.get("error", "Unknown")[:30])
+
+            results["content_fetched"] = [f for f in fetched if f is not None]
 
         print(f"\n{'='*60}")
         print(f"✅ DONE - {results['exa']['total']} articles, {results['youtube']['total']} videos, {results['google']['total']} mentions")
@@ -186,87 +266,83 @@ class FounderScraper:
     def generate_markdown(self, results: dict) -> str:
         """Generate a Markdown report from scraped results."""
 
-        founder = results["founder_name"]
         company = results.get("company_name", "")
 
-        md = f"""# {founder}
-{"*" + company + "*" if company else ""}
-
-*Scraped: {results['scraped_at'][:10]}*
-
----
-
-## 📊 Summary
-
-| Source | Results |
-|--------|---------|
-| Articles & Blogs (Exa) | {results['exa']['total']} |
-| YouTube Videos | {results['youtube']['total']} |
-| Press & Mentions (Google) | {results['google']['total']} |
-
----
+        # Pieces joined once at the end (no quadratic string concatenation)
+        parts = [MARKDOWN_HEADER.format(
+            founder=results["founder_name"],
+            company_line=f"*{company}*" if company else "",
+            scraped_date=results['scraped_at'][:10],
+            exa_total=results['exa']['total'],
+            youtube_total=results['youtube']['total'],
+            google_total=results['google']['total']
+        )]
 
-## 📚 Articles & Blog Posts
-
-"""
         # Exa results
         if results["exa"]["results"]:
             for r in results["exa"]["results"]:
-                md += f"### [{r.get('title', 'Untitled')}]({r.get('url', '')})\n"
-                if r.get('published_date'):
-                    md += f"*{r['published_date'][:10]}*\n"
-                md += f"- Category: {r.get('category', 'article')}\n"
-                md += "\n"
+                parts.append(EXA_ITEM.format(
+                    title=r.get('title', 'Untitled'),
+                    url=r.get('url', ''),
+                    date_line=f"*{r['published_date'][:10]}*\n" if r.get('published_date') else "",
+                    category=r.get('category', 'article')
+                ))
         else:
-            md += "*No articles found*\n\n"
+            parts.append("*No articles found*\n\n")
 
         # Content extracts (full content from Jina)
         if results["content_fetched"]:
-            md += "---\n\n## 📖 Full Content (Scraped)\n\n"
+            parts.append("---\n\n## 📖 Full Content (Scraped)\n\n")
             total_words = sum(c.get('word_count', 0) for c in results["content_fetched"])
-            md += f"*{len(results['content_fetched'])} articles scraped, {total_words:,} words total*\n\n"
+            parts.append(f"*{len(results['content_fetched'])} articles scraped, {total_words:,} words total*\n\n")
 
             for content in results["content_fetched"]:
                 source_tag = content.get('source', 'unknown').upper()
-                md += f"### {content['title']}\n"
-                md += f"*{content['word_count']:,} words* | Source: **{source_tag}** | [Link]({content['url']})\n\n"
-
-                # Full content (or truncated if very long)
-                full_content = content['content'].strip()
-                if len(full_content) > 5000:
-                    md += f"{full_content[:5000]}\n\n*[... truncated, {len(full_content) - 5000:,} more characters]*\n\n"
+                parts.append(f"### {content['title']}\n")
+                parts.append(f"*{content['word_count']:,} words* | Source: **{source_tag}** | [Link]({content['url']})\n\n")
+
+                # Full content (or truncated if very long), stripped by slicing
+                # the original so long bodies are not copied twice
+                text = content['content']
+                start, end = _strip_bounds(text)
+                if end - start > 5000:
+                    parts.append(text[start:start + 5000])
+                    parts.append(f"\n\n*[... truncated, {end - start - 5000:,} more characters]*\n\n")
                 else:
-                    md += f"{full_content}\n\n"
+                    parts.append(text[start:end])
+                    parts.append("\n\n")
 
-                md += "---\n\n"
+                parts.append("---\n\n")
 
         # YouTube
-        md += "---\n\n## 🎬 YouTube Videos\n\n"
+        parts.append("---\n\n## 🎬 YouTube Videos\n\n")
         if results["youtube"]["results"]:
             for v in results["youtube"]["results"][:10]:
-                md += f"- **[{v.get('title', 'Untitled')}]({v.get('url', '')})**\n"
-                md += f"  - Channel: {v.get('channel_title', 'Unknown')}\n"
-                if v.get('published_at'):
-                    md += f"  - Date: {v['published_at'][:10]}\n"
-                md += "\n"
+                parts.append(YOUTUBE_ITEM.format(
+                    title=v.get('title', 'Untitled'),
+                    url=v.get('url', ''),
+                    channel=v.get('channel_title', 'Unknown'),
+                    date_line=f"  - Date: {v['published_at'][:10]}\n" if v.get('published_at') else ""
+                ))
         else:
-            md += "*No videos found*\n\n"
+            parts.append("*No videos found*\n\n")
 
         # Google
-        md += "---\n\n## 🔎 Press & Mentions\n\n"
+        parts.append("---\n\n## 🔎 Press & Mentions\n\n")
         if results["google"]["results"]:
             for g in results["google"]["results"][:10]:
-                md += f"- **[{g.get('title', 'Untitled')}]({g.get('url', '')})**\n"
-                md += f"  - Source: {g.get('source', 'Unknown')}\n"
-                if g.get('snippet'):
-                    md += f"  - *{g['snippet'][:150]}...*\n"
-                md += "\n"
+                parts.append(GOOGLE_ITEM.format(
+                    title=g.get('title', 'Untitled'),
+                    url=g.get('url', ''),
+                    source=g.get('source', 'Unknown'),
+                    snippet_line=f"  - *{g['snippet'][:150]}...*\n" if g.get('snippet') else ""
+                ))
         else:
-            md += "*No press mentions found*\n\n"
+            parts.append("*No press mentions found*\n\n")
 
-        md += "---\n\n*Generated by Founder Scraper*\n"
+        parts.append("---\n\n*Generated by Founder Scraper*\n")
 
-        return md
+        return "".join(parts)
 
     def scrape_and_save(
         self,
@@ -292,12 +368,11 @@ class FounderScraper:
 
         # Output path
         if output_dir is None:
-            output_dir = Path(__file__).parent.parent.parent.parent / "data" / "output"
-        output_dir.mkdir(parents=True, exist_ok=True)
+            output_dir = OUTPUT_DIR
+        self._ensure_dir(output_dir)
 
         # Filename
-        safe_name = founder_name.lower().replace(' ', '-')
-        safe_name = ''.join(c for c in safe_name if c.isalnum() or c == '-')
+        safe_name = safe_slug(founder_name)
         filename = f"{safe_name}.md"
         output_path = output_dir / filename
 
@@ -305,14 +380,26 @@ class FounderScraper:
         output_path.write_text(markdown, encoding='utf-8')
         print(f"📄 Saved to: {output_path}")
 
-        # Also save raw JSON
+        # Also save raw JSON (compact: machine-read cache, the .md is the readable output)
         json_path = output_dir.parent / "cache" / f"{safe_name}_raw.json"
-        json_path.parent.mkdir(parents=True, exist_ok=True)
-        json_path.write_text(json.dumps(results, indent=2, ensure_ascii=False, default=str))
+        self._ensure_dir(json_path.parent)
+        json_path.write_bytes(orjson.dumps(results, default=str))
         print(f"📦 Raw data: {json_path}")
 
         return output_path
 
+    def _ensure_dir(self, path: Path):
+        """Create a directory once per scraper instead of once per saved founder."""
+        if path not in self._known_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(path)
+
+    def save_caches(self):
+        """Write the response caches to disk (also done by close())."""
+        for client in (self.exa, self.jina, self.youtube, self.google):
+            if client:
+                client.cache.save()
+
     def close(self):
         self.exa.close()
         self.jina.close()
@@ -320,38 +407,40 @@ class FounderScraper:
             self.youtube.close()
         if self.google:
             self.google.close()
+        self.transport.close()
 
 
 # CLI
 if __name__ == "__main__":
-    import sys
-
-    if len(sys.argv) < 2:
-        print("Usage: python founder_scraper.py <founder_name> [company_name] [--max=5]")
-        print("")
-        print("Examples:")
-        print("  python founder_scraper.py 'Elon Musk' 'Tesla'")
-        print("  python founder_scraper.py 'Sam Altman' 'OpenAI' --max=10")
-        print("  python founder_scraper.py 'Naval Ravikant'")
-        sys.exit(1)
-
-    founder_name = sys.argv[1]
-    company_name = None
-    max_results = 5
-
-    for arg in sys.argv[2:]:
-        if arg.startswith('--max='):
-            max_results = int(arg.split('=')[1])
-        elif not arg.startswith('--'):
-            company_name = arg
-
-    scraper = FounderScraper()
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Scrape all sources for a founder into a Markdown profile",
+        epilog="""Examples:
+  python founder_scraper.py 'Elon Musk' 'Tesla'
+  python founder_scraper.py 'Sam Altman' 'OpenAI' --max=10
+  python founder_scraper.py 'Naval Ravikant'""",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("founder_name", help="Full name of the founder")
+    parser.add_argument("company_name", nargs="?", help="Company name (optional)")
+    parser.add_argument("--max", type=int, default=5, help="Max results per source")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the cached API responses in data/cache")
+
+    args = parser.parse_args()
+
+    # Per-URL progress is logged at INFO (this module runs as __main__ here)
+    logging.basicConfig(format="%(message)s")
+    for name in ("scripts", __name__):
+        logging.getLogger(name).setLevel(logging.INFO)
+
+    scraper = FounderScraper(use_cache=not args.no_cache)
 
     try:
         output_path = scraper.scrape_and_save(
-            founder_name=founder_name,
-            company_name=company_name,
-            max_results=max_results
+            founder_name=args.founder_name,
+            company_name=args.company_name,
+            max_results=args.max
         )
 
         print(f"\n✅ Profile generated: {output_path}")
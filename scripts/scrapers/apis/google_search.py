@@ -2,17 +2,55 @@
 Google Custom Search API client for finding web content about a person.
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 import httpx
+import orjson
 
-# Load env
-env_file = Path(__file__).parent.parent.parent.parent / ".env.local"
-if env_file.exists():
-    for line in env_file.read_text().splitlines():
-        if line and not line.startswith('#') and '=' in line:
-            key, value = line.split('=', 1)
-            os.environ.setdefault(key.strip(), value.strip())
+from scripts.config import CACHE_DIR
+from scripts.scrapers.cache import ResponseCache
+from scripts.scrapers.rate_limit import TokenBucket
+from scripts.scrapers.transport import shared_transport
+from scripts.scrapers.urls import url_key
+
+CACHE_PATH = CACHE_DIR / "google_cache.json"
+
+# Domains left out of media appearances (social media, etc.), subdomains included
+_EXCLUDED_HOSTS = frozenset({
+    "linkedin.com", "facebook.com", "twitter.com", "x.com",
+    "instagram.com", "tiktok.com", "pinterest.com"
+})
+
+# Video platforms: results there are filed as video appearances
+_VIDEO_HOSTS = frozenset({"youtube.com", "youtu.be", "vimeo.com"})
+
+try:
+    from scripts.enrichment.relevance_filter import RelevanceFilter
+    _HAS_FILTER = True
+except ImportError:  # openai not installed
+    _HAS_FILTER = False
+
+
+def _result_from_item(item: dict) -> dict:
+    """Shape a Custom Search result item."""
+    display_url = item.get("displayLink")
+    return {
+        "title": item.get("title"),
+        "url": item.get("link"),
+        "snippet": item.get("snippet"),
+        "display_url": display_url,
+        "source": (display_url or "").replace("www.", "").split("/", 1)[0]
+    }
+
+
+def _in_domains(host: str, domains: frozenset[str]) -> bool:
+    """True if host or one of its parent domains is in domains."""
+    while host:
+        if host in domains:
+            return True
+        host = host.partition(".")[2]
+    return False
 
 
 class GoogleSearchClient:
@@ -27,7 +65,26 @@ class GoogleSearchClient:
 
     BASE_URL = "https://www.googleapis.com/customsearch/v1"
 
-    def __init__(self, api_key: Optional[str] = None, search_engine_id: Optional[str] = None):
+    # Requests per second (token bucket rate, burst): Custom Search allows 100 queries/minute
+    RATE_LIMIT = (1.5, 10)
+
+    # Queries run in parallel by search_many (the token bucket still caps the rate)
+    MAX_CONCURRENT_QUERIES = 6
+
+    # Custom Search rejects start + num > 100, which caps a query at 99 results
+    MAX_RESULTS = 99
+
+    # Search results are reused for a week (100 free queries/day)
+    CACHE_TTL = 7 * 86400
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        search_engine_id: Optional[str] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        cache_path: Optional[Path] = CACHE_PATH,
+        relevance_filter: Optional["RelevanceFilter"] = None
+    ):
         self.api_key = api_key or os.environ.get("GOOGLE_API_KEY")
         self.search_engine_id = search_engine_id or os.environ.get("GOOGLE_SEARCH_ENGINE_ID")
 
@@ -36,7 +93,27 @@ class GoogleSearchClient:
         if not self.search_engine_id:
             raise ValueError("GOOGLE_SEARCH_ENGINE_ID required")
 
-        self.client = httpx.Client(timeout=30.0)
+        # A shared transport belongs to the caller, who closes it. Otherwise keep
+        # a pool of our own (with retries on 429/5xx).
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = shared_transport(max_connections=10, max_keepalive_connections=6)
+        self.rate_limiter = TokenBucket(*self.RATE_LIMIT)
+        # Credentials go out with every request: set once as client defaults
+        self.client = httpx.Client(
+            params={"key": self.api_key, "cx": self.search_engine_id},
+            timeout=30.0,
+            transport=transport,
+            event_hooks={"request": [self.rate_limiter]}
+        )
+
+        # API responses keyed by request, persisted on close()
+        self.cache = ResponseCache(cache_path, self.CACHE_TTL)
+
+        # Like the transport, an injected filter belongs to the caller. Without one,
+        # the first use_llm_filter search creates a filter that this client closes.
+        self.relevance_filter = relevance_filter
+        self._owns_filter = False
 
     def search(self, query: str, num_results: int = 10, start: int = 1) -> list[dict]:
         """
@@ -50,29 +127,68 @@ class GoogleSearchClient:
         Returns:
             List of search results
         """
+        num = min(num_results, 10)
+        return self.cache.get_or_fetch(
+            f"search|{self.search_engine_id}|{query}|{num}|{start}",
+            lambda: self._search(query, num, start)
+        )
+
+    def _search(self, query: str, num: int, start: int) -> list[dict]:
         resp = self.client.get(
             self.BASE_URL,
             params={
-                "key": self.api_key,
-                "cx": self.search_engine_id,
                 "q": query,
-                "num": min(num_results, 10),
+                "num": num,
                 "start": start
             }
         )
         resp.raise_for_status()
-        data = resp.json()
-
-        results = []
-        for item in data.get("items", []):
-            results.append({
-                "title": item.get("title"),
-                "url": item.get("link"),
-                "snippet": item.get("snippet"),
-                "display_url": item.get("displayLink"),
-                "source": item.get("displayLink", "").replace("www.", "").split("/")[0]
-            })
+        return [_result_from_item(item) for item in orjson.loads(resp.content).get("items", [])]
 
+    def search_many(self, queries: list[str], num_results: int = 10) -> list[Union[list[dict], Exception]]:
+        """
+        Run several searches concurrently.
+
+        More than 10 results per query (up to MAX_RESULTS) are fetched as
+        pages of 10 (start=1, 11, ...), all sent at once rather than one after
+        the other.
+
+        Returns one entry per query, in order: its results, or the exception
+        it raised (so one failing query doesn't lose the others). If a later
+        page fails, the pages before it are kept.
+        """
+        num_results = max(1, min(num_results, self.MAX_RESULTS))
+        starts = range(1, num_results + 1, 10)
+        pages = [(query, start) for query in queries for start in starts]
+
+        def _search(page: tuple[str, int]):
+            query, start = page
+            try:
+                return self.search(query, num_results=min(10, num_results - start + 1), start=start)
+            except Exception as e:
+                return e
+
+        if not pages:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_QUERIES, len(pages))) as pool:
+            fetched = list(pool.map(_search, pages))
+
+        responses = []
+        for i in range(0, len(fetched), len(starts)):
+            first, *rest = fetched[i:i + len(starts)]
+            if not isinstance(first, Exception):
+                for page in rest:
+                    if isinstance(page, Exception):
+                        break
+                    first = first + page
+            responses.append(first)
+        return responses
+
+    def search_paged(self, query: str, total: int = 50) -> list[dict]:
+        """Up to `total` results (max MAX_RESULTS) for one query, pages fetched concurrently."""
+        results = self.search_many([query], num_results=total)[0]
+        if isinstance(results, Exception):
+            raise results
         return results
 
     def search_person_content(self, person_name: str, max_results_per_category: int = 10) -> dict:
@@ -106,21 +222,27 @@ class GoogleSearchClient:
             "total_found": 0
         }
 
-        seen_urls = set()
-
-        for query, category in search_queries:
-            try:
-                search_results = self.search(query, num_results=max_results_per_category)
-                for result in search_results:
-                    url = result.get("url")
-                    if url and url not in seen_urls:
-                        seen_urls.add(url)
-                        results[category].append(result)
-                        results["all_results"].append({**result, "category": category})
-            except Exception as e:
-                print(f"  Google search error for '{query}': {e}")
-
-        results["total_found"] = len(seen_urls)
+        # Same page under another URL form (www., trailing slash, utm_ params) counts once
+        seen_keys = set()
+
+        # Queries run concurrently; results are merged in query order
+        responses = self.search_many([query for query, _ in search_queries], num_results=max_results_per_category)
+
+        for (query, category), search_results in zip(search_queries, responses):
+            if isinstance(search_results, Exception):
+                print(f"  Google search error for '{query}': {search_results}")
+                continue
+            for result in search_results:
+                url = result.get("url")
+                if not url:
+                    continue
+                key = url_key(url)
+                if key not in seen_keys:
+                    seen_keys.add(key)
+                    results[category].append(result)
+                    results["all_results"].append({**result, "category": category})
+
+        results["total_found"] = len(seen_keys)
         return results
 
     def search_media_appearances(
@@ -128,7 +250,8 @@ class GoogleSearchClient:
         person_name: str,
         company_name: Optional[str] = None,
         use_llm_filter: bool = False,
-        min_relevance_score: int = 0
+        min_relevance_score: int = 0,
+        results_per_query: int = 10
     ) -> dict:
         """
         Specifically search for media appearances (podcasts, videos, interviews).
@@ -138,6 +261,7 @@ class GoogleSearchClient:
             company_name: Optional company name for more targeted search
             use_llm_filter: Whether to use LLM to verify relevance
             min_relevance_score: Minimum score (0-100) to keep results
+            results_per_query: Results fetched per query (over 10: several pages)
 
         Returns:
             Dict with media appearance results
@@ -149,7 +273,8 @@ class GoogleSearchClient:
 
         # Step 1: Collect raw results
         all_results = []
-        seen_urls = set()
+        seen_keys = set()
+        video_urls = set()  # Hosts are checked once, here, for Step 3
 
         search_queries = [
             f'{base_name} podcast',
@@ -158,33 +283,30 @@ class GoogleSearchClient:
             f'{base_name} article OR blog',
         ]
 
-        # Domains to exclude (social media, etc.)
-        excluded_domains = [
-            "linkedin.com", "facebook.com", "twitter.com", "x.com",
-            "instagram.com", "tiktok.com", "pinterest.com"
-        ]
-
-        for query in search_queries:
-            try:
-                results = self.search(query, num_results=10)
-                for r in results:
-                    url = r.get("url", "")
-                    if url and url not in seen_urls:
-                        # Skip excluded domains
-                        if any(domain in url.lower() for domain in excluded_domains):
-                            continue
-                        seen_urls.add(url)
-                        all_results.append(r)
-            except Exception as e:
-                print(f"    Google search error for '{query}': {e}")
+        # Queries run concurrently; results are merged in query order
+        for query, results in zip(search_queries, self.search_many(search_queries, num_results=results_per_query)):
+            if isinstance(results, Exception):
+                print(f"    Google search error for '{query}': {results}")
+                continue
+            for r in results:
+                url = r.get("url", "")
+                if not url:
+                    continue
+                key = url_key(url)
+                if key not in seen_keys:
+                    # Skip excluded domains
+                    if _in_domains(key[0], _EXCLUDED_HOSTS):
+                        continue
+                    seen_keys.add(key)
+                    if _in_domains(key[0], _VIDEO_HOSTS):
+                        video_urls.add(url)
+                    all_results.append(r)
 
         # Step 2: Filter with LLM if enabled
-        if use_llm_filter and all_results:
+        if use_llm_filter and _HAS_FILTER and all_results:
             try:
-                from scripts.enrich.sources.relevance_filter import RelevanceFilter
-
                 print(f"    Filtering {len(all_results)} results with LLM...")
-                filter = RelevanceFilter()
+                filter = self._get_relevance_filter()
                 context = f"Founder/CEO of {company_name}" if company_name else f"Professional content about {person_name}"
 
                 filtered_results = filter.filter_results(
@@ -215,12 +337,12 @@ class GoogleSearchClient:
 
         for r in filtered_results:
             category = r.get("category", "article")
-            url = r.get("url", "")
+            is_video = r.get("url", "") in video_urls
 
             if category == "podcast":
                 results["podcast_episodes"].append(r)
             elif category == "interview":
-                if "youtube.com" in url or "vimeo.com" in url:
+                if is_video:
                     results["video_appearances"].append(r)
                 else:
                     results["written_interviews"].append(r)
@@ -230,15 +352,27 @@ class GoogleSearchClient:
                 results["articles"].append(r)
             else:
                 # Default: categorize by URL
-                if "youtube.com" in url or "vimeo.com" in url:
+                if is_video:
                     results["video_appearances"].append(r)
                 else:
                     results["articles"].append(r)
 
         return results
 
+    def _get_relevance_filter(self) -> "RelevanceFilter":
+        if self.relevance_filter is None:
+            if not _HAS_FILTER:
+                raise ImportError("use_llm_filter requires the openai package (pip install openai)")
+            self.relevance_filter = RelevanceFilter()
+            self._owns_filter = True
+        return self.relevance_filter
+
     def close(self):
-        self.client.close()
+        self.cache.save()
+        if self._owns_filter:
+            self.relevance_filter.close()
+        if self._owns_transport:
+            self.client.close()
 
 
 # Quick test
@@ -3,18 +3,40 @@ Jina Reader API client for converting URLs to Markdown.
 
 Takes any URL and returns clean, readable Markdown content.
 """
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 import httpx
+import orjson
 
-# Load env
-env_file = Path(__file__).parent.parent.parent.parent / ".env.local"
-if env_file.exists():
-    for line in env_file.read_text().splitlines():
-        if line and not line.startswith('#') and '=' in line:
-            key, value = line.split('=', 1)
-            os.environ.setdefault(key.strip(), value.strip())
+from scripts.config import CACHE_DIR
+from scripts.scrapers.cache import ResponseCache
+from scripts.scrapers.rate_limit import TokenBucket
+from scripts.scrapers.transport import shared_transport
+
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = CACHE_DIR / "jina_cache.json"
+
+# A text/plain read is a few "Name: value" lines, then the page markdown.
+# Header names map to the keys of the JSON response's "data"
+_PLAIN_CONTENT_MARKER = "\nMarkdown Content:\n"
+_PLAIN_FIELDS = {"Title": "title", "Published Time": "publishedTime"}
+
+
+def _parse_plain(text: str) -> dict:
+    """Split a text/plain read into a dict shaped like the JSON "data"."""
+    head, sep, content = text.partition(_PLAIN_CONTENT_MARKER)
+    if not sep:
+        return {"content": text}
+    page = {"content": content}
+    for line in head.splitlines():
+        name, _, value = line.partition(": ")
+        if name in _PLAIN_FIELDS:
+            page[_PLAIN_FIELDS[name]] = value.strip()
+    return page
 
 
 class JinaReader:
@@ -26,21 +48,55 @@ class JinaReader:
 
     BASE_URL = "https://r.jina.ai"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Requests per second (token bucket rate, burst)
+    RATE_LIMIT = (5, 10)
+
+    # URLs read in parallel by iter_read (the token bucket still caps the rate)
+    MAX_CONCURRENT_READS = 8
+
+    # Successful page reads are reused for 90 days (most recent 2000 pages):
+    # published articles and show notes rarely change
+    CACHE_TTL = 90 * 86400
+    CACHE_MAX_ENTRIES = 2000
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        cache_path: Optional[Path] = CACHE_PATH,
+        plain: bool = False
+    ):
+        """
+        With `plain=True` pages are fetched as text/plain: the markdown comes
+        unescaped (smaller response, no JSON to decode) but only the title and
+        published date come with it, not the description or author.
+        """
         self.api_key = api_key or os.environ.get("JINA_API_KEY")
+        self.plain = plain
 
         headers = {
-            "Accept": "application/json"
+            "Accept": "text/plain" if plain else "application/json"
         }
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
 
+        # A shared transport belongs to the caller, who closes it. Otherwise keep
+        # a pool of our own, sized for the concurrent reads of iter_read.
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = shared_transport(max_connections=20, max_keepalive_connections=10)
+        self.rate_limiter = TokenBucket(*self.RATE_LIMIT)
         self.client = httpx.Client(
-            timeout=60.0,
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            transport=transport,
             headers=headers,
-            follow_redirects=True
+            follow_redirects=True,
+            event_hooks={"request": [self.rate_limiter]}
         )
 
+        # Page contents keyed by URL, persisted on close()
+        self.cache = ResponseCache(cache_path, self.CACHE_TTL, self.CACHE_MAX_ENTRIES)
+
     def read_url(self, url: str) -> dict:
         """
         Convert a URL to Markdown content.
@@ -51,22 +107,37 @@ class JinaReader:
         Returns:
             Dict with title, content (markdown), and metadata
         """
+        # Jina can only fetch web pages: don't spend a request on anything else
+        if not url.startswith(("http://", "https://")):
+            return {"success": False, "url": url, "error": "Not an http(s) URL"}
+
+        # Failed reads are not cached, so they are retried next time. Plain
+        # reads lack some fields: they are cached apart from JSON ones
+        key = f"{'read-plain' if self.plain else 'read'}|{url}"
+        return self.cache.get_or_fetch(key, lambda: self._read_url(url), keep=lambda r: r["success"])
+
+    def _read_url(self, url: str) -> dict:
         try:
             # Jina Reader API: GET https://r.jina.ai/{url}
             resp = self.client.get(f"{self.BASE_URL}/{url}")
             resp.raise_for_status()
 
-            data = resp.json()
+            if self.plain:
+                page = _parse_plain(resp.text)
+            else:
+                # Page content can be large: parse the raw bytes with orjson
+                page = orjson.loads(resp.content).get("data", {})
+            content = page.get("content", "")
 
             return {
                 "success": True,
                 "url": url,
-                "title": data.get("data", {}).get("title", ""),
-                "content": data.get("data", {}).get("content", ""),
-                "description": data.get("data", {}).get("description", ""),
-                "published_date": data.get("data", {}).get("publishedTime"),
-                "author": data.get("data", {}).get("author"),
-                "word_count": len(data.get("data", {}).get("content", "").split()),
+                "title": page.get("title", ""),
+                "content": content,
+                "description": page.get("description", ""),
+                "published_date": page.get("publishedTime"),
+                "author": page.get("author"),
+                "word_count": len(content.split()),
             }
 
         except httpx.HTTPStatusError as e:
@@ -82,31 +153,50 @@ class JinaReader:
                 "error": str(e)
             }
 
-    def read_multiple(self, urls: list[str]) -> list[dict]:
+    def iter_read(self, urls: list[str], concurrency: Optional[int] = None) -> Iterator[tuple[int, dict]]:
         """
-        Read multiple URLs.
+        Read URLs concurrently, yielding (index in urls, read_url result) as
+        each read completes.
+
+        Reads overlap (up to `concurrency`, default MAX_CONCURRENT_READS, at a
+        time), so the total time is close to the slowest pages rather than the
+        sum of all of them, and a slow page doesn't hold back the results of
+        the others.
+        """
+        if not urls:
+            return
+        max_workers = min(concurrency or self.MAX_CONCURRENT_READS, len(urls))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(self.read_url, url): i for i, url in enumerate(urls)}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def read_multiple(self, urls: list[str], concurrency: Optional[int] = None) -> list[dict]:
+        """
+        Read multiple URLs (concurrently, see iter_read).
 
         Args:
             urls: List of URLs to read
+            concurrency: Maximum reads in flight (default MAX_CONCURRENT_READS)
 
         Returns:
-            List of results (some may have failed)
+            List of results in the order of urls (some may have failed)
         """
-        results = []
-        for i, url in enumerate(urls):
-            print(f"  [{i+1}/{len(urls)}] Reading: {url[:60]}...")
-            result = self.read_url(url)
-            results.append(result)
-
+        results = [None] * len(urls)
+        # Results arrive in completion order: count them rather than show the index
+        for done, (i, result) in enumerate(self.iter_read(urls, concurrency), 1):
+            results[i] = result
             if result["success"]:
-                print(f"    ✓ {result['word_count']} words")
+                logger.info("  [%d/%d] %s... ✓ %d words", done, len(urls), urls[i][:60], result["word_count"])
             else:
-                print(f"    ✗ {result['error'][:50]}")
+                logger.info("  [%d/%d] %s... ✗ %s", done, len(urls), urls[i][:60], result["error"][:50])
 
         return results
 
     def close(self):
-        self.client.close()
+        self.cache.save()
+        if self._owns_transport:
+            self.client.close()
 
 
 # CLI for testing
@@ -114,8 +204,8 @@ if __name__ == "__main__":
     import sys
 
     if len(sys.argv) < 2:
-        print("Usage: python jina.py <url>")
-        print("Example: python jina.py https://medium.com/@example/article")
+        print("Usage: python -m scripts.scrapers.apis.jina <url>")
+        print("Example: python -m scripts.scrapers.apis.jina https://medium.com/@example/article")
         sys.exit(1)
 
     url = sys.argv[1]
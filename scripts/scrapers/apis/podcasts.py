@@ -1,18 +1,52 @@
 """
 Listen Notes API client for finding podcast appearances.
 """
+import hashlib
 import os
+import time
 from pathlib import Path
 from typing import Optional
 import httpx
-
-# Load env
-env_file = Path(__file__).parent.parent.parent.parent / ".env.local"
-if env_file.exists():
-    for line in env_file.read_text().splitlines():
-        if line and not line.startswith('#') and '=' in line:
-            key, value = line.split('=', 1)
-            os.environ.setdefault(key.strip(), value.strip())
+import orjson
+
+from scripts.config import CACHE_DIR
+from scripts.scrapers.cache import ResponseCache
+from scripts.scrapers.rate_limit import TokenBucket
+from scripts.scrapers.transport import shared_transport
+
+CACHE_PATH = CACHE_DIR / "listennotes_cache.json"
+
+# Title words hinting at how the person appears (plain substring checks on the
+# lowercased title: a regex alternation was no faster on titles this short)
+_GUEST_WORDS = ("interview", "guest", "with", "featuring")
+_HOST_WORDS = ("host", "presents", "show")
+
+# Parameters shared by every episode search
+_EPISODE_SEARCH_PARAMS = {
+    "type": "episode",
+    "len_min": 5,  # Minimum 5 minutes (filter out short clips)
+    "only_in": "title,description"
+}
+
+
+def _episode_from_item(item: dict) -> dict:
+    """Flatten a Listen Notes episode search result (podcast looked up once)."""
+    podcast = item.get("podcast") or {}
+    return {
+        "episode_id": item.get("id"),
+        "title": item.get("title_original"),
+        # Descriptions can be long: only the start is kept
+        "description": (item.get("description_original") or "")[:500],
+        "podcast_name": podcast.get("title_original"),
+        "podcast_id": podcast.get("id"),
+        "publisher": podcast.get("publisher_original"),
+        "audio_url": item.get("audio"),
+        "listennotes_url": item.get("listennotes_url"),
+        "published_date": item.get("pub_date_ms"),
+        "duration_seconds": item.get("audio_length_sec"),
+        "thumbnail": item.get("thumbnail"),
+        "explicit": item.get("explicit_content", False)
+    }
 
 
 class ListenNotesClient:
@@ -26,16 +60,38 @@ class ListenNotesClient:
 
     BASE_URL = "https://listen-api.listennotes.com/api/v2"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Requests per second (token bucket rate, burst)
+    RATE_LIMIT = (2, 5)
+
+    # Episode searches and details are reused for 30 days (free tier: 300 requests/month)
+    CACHE_TTL = 30 * 86400
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        cache_path: Optional[Path] = CACHE_PATH
+    ):
         self.api_key = api_key or os.environ.get("LISTENNOTES_API_KEY")
         if not self.api_key:
             raise ValueError("LISTENNOTES_API_KEY required")
 
+        # A shared transport belongs to the caller, who closes it. Otherwise keep
+        # a pool of our own (with retries on 429/5xx).
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = shared_transport(max_connections=10, max_keepalive_connections=5)
+        self.rate_limiter = TokenBucket(*self.RATE_LIMIT)
         self.client = httpx.Client(
             headers={"X-ListenAPI-Key": self.api_key},
-            timeout=30.0
+            timeout=30.0,
+            transport=transport,
+            event_hooks={"request": [self.rate_limiter]}
         )
 
+        # API responses keyed by request, persisted on close()
+        self.cache = ResponseCache(cache_path, self.CACHE_TTL)
+
     def search_episodes(self, query: str, max_results: int = 10, sort_by: str = "relevance") -> list[dict]:
         """
         Search for podcast episodes.
@@ -48,38 +104,23 @@ class ListenNotesClient:
         Returns:
             List of episode results
         """
+        return self.cache.get_or_fetch(
+            f"search|{query}|{max_results}|{sort_by}",
+            lambda: self._search_episodes(query, max_results, sort_by)
+        )
+
+    def _search_episodes(self, query: str, max_results: int, sort_by: str) -> list[dict]:
         resp = self.client.get(
             f"{self.BASE_URL}/search",
             params={
+                **_EPISODE_SEARCH_PARAMS,
                 "q": query,
-                "type": "episode",
                 "sort_by_date": 1 if sort_by == "recent" else 0,
-                "len_min": 5,  # Minimum 5 minutes (filter out short clips)
-                "only_in": "title,description",
                 "page_size": min(max_results, 10)
             }
         )
         resp.raise_for_status()
-        data = resp.json()
-
-        episodes = []
-        for item in data.get("results", []):
-            episodes.append({
-                "episode_id": item.get("id"),
-                "title": item.get("title_original"),
-                "description": item.get("description_original", "")[:500],
-                "podcast_name": item.get("podcast", {}).get("title_original"),
-                "podcast_id": item.get("podcast", {}).get("id"),
-                "publisher": item.get("podcast", {}).get("publisher_original"),
-                "audio_url": item.get("audio"),
-                "listennotes_url": item.get("listennotes_url"),
-                "published_date": item.get("pub_date_ms"),
-                "duration_seconds": item.get("audio_length_sec"),
-                "thumbnail": item.get("thumbnail"),
-                "explicit": item.get("explicit_content", False)
-            })
-
-        return episodes
+        return [_episode_from_item(item) for item in orjson.loads(resp.content).get("results", [])]
 
     def search_person_appearances(self, person_name: str, max_results: int = 20) -> dict:
         """
@@ -98,8 +139,12 @@ class ListenNotesClient:
             "as_host": [],
             "mentioned": [],
             "total_found": 0,
-            "podcasts_appeared_on": set()
+            "podcasts_appeared_on": [],
+            "episodes_per_podcast": {}
         }
+        episodes_per_podcast = {}
+
+        name_lower = person_name.lower()
 
         # Search with exact name match
         try:
@@ -107,16 +152,14 @@ class ListenNotesClient:
 
             for ep in episodes:
                 title = (ep.get("title") or "").lower()
-                description = (ep.get("description") or "").lower()
-                name_lower = person_name.lower()
 
                 # Categorize the appearance
                 if name_lower in title:
                     # Name in title = likely guest or main topic
-                    if any(word in title for word in ["interview", "guest", "with", "featuring"]):
+                    if any(word in title for word in _GUEST_WORDS):
                         ep["appearance_type"] = "guest"
                         results["as_guest"].append(ep)
-                    elif any(word in title for word in ["host", "presents", "show"]):
+                    elif any(word in title for word in _HOST_WORDS):
                         ep["appearance_type"] = "host"
                         results["as_host"].append(ep)
                     else:
@@ -129,29 +172,39 @@ class ListenNotesClient:
 
                 results["episodes"].append(ep)
 
-                # Track unique podcasts
-                if ep.get("podcast_name"):
-                    results["podcasts_appeared_on"].add(ep["podcast_name"])
+                # Count episodes per podcast (dicts keep first-seen order)
+                podcast = ep.get("podcast_name")
+                if podcast:
+                    episodes_per_podcast[podcast] = episodes_per_podcast.get(podcast, 0) + 1
 
         except Exception as e:
             print(f"  Listen Notes search error: {e}")
 
         results["total_found"] = len(results["episodes"])
-        results["podcasts_appeared_on"] = list(results["podcasts_appeared_on"])
+        # Podcasts with the most episodes first (ties keep search order)
+        ranked = sorted(episodes_per_podcast.items(), key=lambda item: item[1], reverse=True)
+        results["episodes_per_podcast"] = dict(ranked)
+        results["podcasts_appeared_on"] = [podcast for podcast, _ in ranked]
 
         return results
 
     def get_episode_details(self, episode_id: str) -> Optional[dict]:
         """Get detailed info about a specific episode."""
+        return self.cache.get_or_fetch(f"episode|{episode_id}", lambda: self._get_episode_details(episode_id))
+
+    def _get_episode_details(self, episode_id: str) -> Optional[dict]:
         resp = self.client.get(f"{self.BASE_URL}/episodes/{episode_id}")
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
     def get_podcast_info(self, podcast_id: str) -> Optional[dict]:
         """Get info about a podcast show."""
+        return self.cache.get_or_fetch(f"podcast|{podcast_id}", lambda: self._get_podcast_info(podcast_id))
+
+    def _get_podcast_info(self, podcast_id: str) -> Optional[dict]:
         resp = self.client.get(f"{self.BASE_URL}/podcasts/{podcast_id}")
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
 
         return {
             "podcast_id": data.get("id"),
@@ -169,7 +222,9 @@ class ListenNotesClient:
         }
 
     def close(self):
-        self.client.close()
+        self.cache.save()
+        if self._owns_transport:
+            self.client.close()
 
 
 class PodcastIndexClient:
@@ -183,30 +238,42 @@ class PodcastIndexClient:
 
     BASE_URL = "https://api.podcastindex.org/api/1.0"
 
-    def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        transport: Optional[httpx.BaseTransport] = None
+    ):
         self.api_key = api_key or os.environ.get("PODCASTINDEX_API_KEY")
         self.api_secret = api_secret or os.environ.get("PODCASTINDEX_API_SECRET")
 
         if not self.api_key or not self.api_secret:
             raise ValueError("PODCASTINDEX_API_KEY and PODCASTINDEX_API_SECRET required")
 
-        import hashlib
-        import time
+        # A shared transport belongs to the caller, who closes it. Otherwise keep
+        # a pool of our own (with retries on 429/5xx).
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = shared_transport(max_connections=10, max_keepalive_connections=5)
+        self.client = httpx.Client(
+            headers={"User-Agent": "founders-graph/1.0"},
+            timeout=30.0,
+            transport=transport,
+            event_hooks={"request": [self._sign]}
+        )
 
-        # Podcast Index requires auth headers
+    def _sign(self, request: httpx.Request):
+        """
+        Request event hook adding the Podcast Index auth headers.
+
+        The signature covers the current time and the API only accepts recent
+        ones, so it is computed per request rather than once per client.
+        """
         epoch_time = str(int(time.time()))
         auth_string = self.api_key + self.api_secret + epoch_time
-        auth_hash = hashlib.sha1(auth_string.encode()).hexdigest()
-
-        self.client = httpx.Client(
-            headers={
-                "User-Agent": "founders-graph/1.0",
-                "X-Auth-Key": self.api_key,
-                "X-Auth-Date": epoch_time,
-                "Authorization": auth_hash
-            },
-            timeout=30.0
-        )
+        request.headers["X-Auth-Key"] = self.api_key
+        request.headers["X-Auth-Date"] = epoch_time
+        request.headers["Authorization"] = hashlib.sha1(auth_string.encode()).hexdigest()
 
     def search_episodes(self, query: str, max_results: int = 10) -> list[dict]:
         """Search for podcast episodes by person name."""
@@ -215,7 +282,7 @@ class PodcastIndexClient:
             params={"q": query, "max": max_results}
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
 
         episodes = []
         for item in data.get("feeds", []):
@@ -232,7 +299,8 @@ class PodcastIndexClient:
         return episodes
 
     def close(self):
-        self.client.close()
+        if self._owns_transport:
+            self.client.close()
 
 
 # Quick test
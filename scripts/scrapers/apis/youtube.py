@@ -2,18 +2,59 @@
 YouTube Data API client for finding video content about a person.
 """
 import os
+import logging
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 import httpx
 
-# Load env
-env_file = Path(__file__).parent.parent.parent.parent / ".env.local"
-if env_file.exists():
-    for line in env_file.read_text().splitlines():
-        if line and not line.startswith('#') and '=' in line:
-            key, value = line.split('=', 1)
-            os.environ.setdefault(key.strip(), value.strip())
+from scripts.config import CACHE_DIR
+from scripts.scrapers.cache import ResponseCache
+from scripts.scrapers.rate_limit import TokenBucket
+from scripts.scrapers.transport import shared_transport
+
+try:
+    from scripts.enrichment.relevance_filter import RelevanceFilter
+    _HAS_FILTER = True
+except ImportError:  # openai not installed
+    _HAS_FILTER = False
+
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = CACHE_DIR / "youtube_cache.json"
+
+_WATCH_URL = "https://www.youtube.com/watch?v={}".format
+
+# search_person_content queries: the qualified search, then the bare-name fallback
+_QUALIFIED_QUERY = '"{name}" (interview OR podcast OR talk OR keynote OR conference)'
+_FALLBACK_QUERY = '"{name}"'
+
+# Video category -> results key (anything else goes to "mentions")
+_CAT_KEY = {
+    "interview": "interviews",
+    "podcast": "podcasts",
+    "talk": "talks",
+    "own_content": "own_content",
+}
+
+
+def _video_from_item(item: dict, include_channel: bool = True) -> dict:
+    """Flatten a search API item into a video dict (each nested lookup done once)."""
+    snippet = item.get("snippet", {})
+    video_id = item.get("id", {}).get("videoId")
+
+    video = {
+        "video_id": video_id,
+        "title": snippet.get("title"),
+        "description": snippet.get("description")
+    }
+    if include_channel:
+        video["channel_title"] = snippet.get("channelTitle")
+        video["channel_id"] = snippet.get("channelId")
+    video["published_at"] = snippet.get("publishedAt")
+    video["thumbnail"] = snippet.get("thumbnails", {}).get("high", {}).get("url")
+    video["url"] = _WATCH_URL(video_id)
+    return video
 
 
 class YouTubeClient:
@@ -21,12 +62,43 @@ class YouTubeClient:
 
     BASE_URL = "https://www.googleapis.com/youtube/v3"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Requests per second (token bucket rate, burst)
+    RATE_LIMIT = (10, 10)
+
+    # Search and channel responses are reused for a day
+    CACHE_TTL = 86400
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        cache_path: Optional[Path] = CACHE_PATH,
+        relevance_filter: Optional["RelevanceFilter"] = None
+    ):
         self.api_key = api_key or os.environ.get("YOUTUBE_API_KEY")
         if not self.api_key:
             raise ValueError("YOUTUBE_API_KEY required")
 
-        self.client = httpx.Client(timeout=30.0)
+        # A shared transport belongs to the caller, who closes it. Otherwise keep
+        # a pool of our own: every call goes to googleapis.com, so connections
+        # (multiplexed over HTTP/2 when available) are reused across searches.
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = shared_transport(max_connections=40, max_keepalive_connections=20)
+        self.rate_limiter = TokenBucket(*self.RATE_LIMIT)
+        self.client = httpx.Client(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            transport=transport,
+            event_hooks={"request": [self.rate_limiter]}
+        )
+
+        # API responses keyed by request, persisted on close()
+        self.cache = ResponseCache(cache_path, self.CACHE_TTL)
+
+        # Like the transport, an injected filter belongs to the caller. Without one,
+        # the first use_llm_filter search creates a filter that this client closes.
+        self.relevance_filter = relevance_filter
+        self._owns_filter = False
 
     def search_videos(self, query: str, max_results: int = 25) -> list[dict]:
         """
@@ -39,6 +111,12 @@ class YouTubeClient:
         Returns:
             List of video results with metadata
         """
+        return self.cache.get_or_fetch(
+            f"search|{query}|{max_results}",
+            lambda: self._search_videos(query, max_results)
+        )
+
+    def _search_videos(self, query: str, max_results: int) -> list[dict]:
         resp = self.client.get(
             f"{self.BASE_URL}/search",
             params={
@@ -51,23 +129,7 @@ class YouTubeClient:
             }
         )
         resp.raise_for_status()
-        data = resp.json()
-
-        videos = []
-        for item in data.get("items", []):
-            snippet = item.get("snippet", {})
-            videos.append({
-                "video_id": item.get("id", {}).get("videoId"),
-                "title": snippet.get("title"),
-                "description": snippet.get("description"),
-                "channel_title": snippet.get("channelTitle"),
-                "channel_id": snippet.get("channelId"),
-                "published_at": snippet.get("publishedAt"),
-                "thumbnail": snippet.get("thumbnails", {}).get("high", {}).get("url"),
-                "url": f"https://www.youtube.com/watch?v={item.get('id', {}).get('videoId')}"
-            })
-
-        return videos
+        return [_video_from_item(item) for item in resp.json().get("items", [])]
 
     def search_person_content(
         self,
@@ -91,35 +153,34 @@ class YouTubeClient:
         Returns:
             Dict with categorized video results
         """
-        # Step 1: Collect raw results from YouTube
-        search_queries = [
-            f'"{person_name}" interview',
-            f'"{person_name}" podcast',
-            f'"{person_name}" talk OR keynote OR conference',
-            f'"{person_name}"',
-        ]
-
-        all_videos = []
-        seen_ids = set()
-
-        for query in search_queries:
+        # Step 1: Collect raw results from YouTube. One OR query replaces the
+        # interview/podcast/talk searches (it gets their combined result budget);
+        # the bare name is only searched when that comes back short.
+        qualified_query = _QUALIFIED_QUERY.format(name=person_name)
+        fallback_query = _FALLBACK_QUERY.format(name=person_name)
+
+        # video_id -> video, in first-seen order
+        unique_videos: dict[str, dict] = {}
+
+        for query, query_max in ((qualified_query, max_results * 3), (fallback_query, max_results)):
+            if query is fallback_query and len(unique_videos) >= max_results:
+                break
             try:
-                videos = self.search_videos(query, max_results=max_results)
-                for video in videos:
-                    vid_id = video.get("video_id")
-                    if vid_id and vid_id not in seen_ids:
-                        seen_ids.add(vid_id)
-                        all_videos.append(video)
+                videos = self.search_videos(query, max_results=query_max)
             except Exception as e:
-                print(f"    YouTube search error for '{query}': {e}")
+                logger.warning("YouTube search error for %r: %s", query, e)
+                continue
+            for video in videos:
+                if video.get("video_id"):
+                    unique_videos.setdefault(video["video_id"], video)
+
+        all_videos = list(unique_videos.values())
 
         # Step 2: Filter with LLM if enabled
-        if use_llm_filter and all_videos:
+        if use_llm_filter and _HAS_FILTER and all_videos:
             try:
-                from scripts.enrich.sources.relevance_filter import RelevanceFilter
-
-                print(f"    Filtering {len(all_videos)} videos with LLM...")
-                filter = RelevanceFilter()
+                logger.info("Filtering %d videos with LLM...", len(all_videos))
+                filter = self._get_relevance_filter()
                 context = person_context or f"Professional content about {person_name}"
 
                 filtered_videos = filter.filter_results(
@@ -129,9 +190,9 @@ class YouTubeClient:
                     min_relevance_score=min_relevance_score
                 )
 
-                print(f"    → {len(filtered_videos)} relevant videos kept")
+                logger.info("%d relevant videos kept", len(filtered_videos))
             except Exception as e:
-                print(f"    LLM filter error: {e}, using raw results")
+                logger.warning("LLM filter error: %s, using raw results", e)
                 filtered_videos = all_videos
         else:
             filtered_videos = all_videos
@@ -149,22 +210,15 @@ class YouTubeClient:
         }
 
         for video in filtered_videos:
-            category = video.get("category", "mentions")
-            if category == "interview":
-                results["interviews"].append(video)
-            elif category == "podcast":
-                results["podcasts"].append(video)
-            elif category == "talk":
-                results["talks"].append(video)
-            elif category == "own_content":
-                results["own_content"].append(video)
-            else:
-                results["mentions"].append(video)
+            results[_CAT_KEY.get(video.get("category"), "mentions")].append(video)
 
         return results
 
     def get_channel_info(self, channel_id: str) -> Optional[dict]:
         """Get channel details by ID."""
+        return self.cache.get_or_fetch(f"channel|{channel_id}", lambda: self._get_channel_info(channel_id))
+
+    def _get_channel_info(self, channel_id: str) -> Optional[dict]:
         resp = self.client.get(
             f"{self.BASE_URL}/channels",
             params={
@@ -211,24 +265,22 @@ class YouTubeClient:
             }
         )
         resp.raise_for_status()
-        data = resp.json()
-
-        videos = []
-        for item in data.get("items", []):
-            snippet = item.get("snippet", {})
-            videos.append({
-                "video_id": item.get("id", {}).get("videoId"),
-                "title": snippet.get("title"),
-                "description": snippet.get("description"),
-                "published_at": snippet.get("publishedAt"),
-                "thumbnail": snippet.get("thumbnails", {}).get("high", {}).get("url"),
-                "url": f"https://www.youtube.com/watch?v={item.get('id', {}).get('videoId')}"
-            })
+        return [_video_from_item(item, include_channel=False) for item in resp.json().get("items", [])]
 
-        return videos
+    def _get_relevance_filter(self) -> "RelevanceFilter":
+        if self.relevance_filter is None:
+            if not _HAS_FILTER:
+                raise ImportError("use_llm_filter requires the openai package (pip install openai)")
+            self.relevance_filter = RelevanceFilter()
+            self._owns_filter = True
+        return self.relevance_filter
 
     def close(self):
-        self.client.close()
+        self.cache.save()
+        if self._owns_filter:
+            self.relevance_filter.close()
+        if self._owns_transport:
+            self.client.close()
 
 
 # Quick test
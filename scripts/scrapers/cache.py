@@ -0,0 +1,98 @@
+"""
+JSON response cache for the API clients.
+"""
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import orjson
+
+
+class ResponseCache:
+    """
+    Key -> JSON value store with a TTL, kept in memory and saved to one file.
+
+    Keys are hashed (blake2b), values must be orjson-serializable. With
+    `path=None` nothing is cached and every call fetches.
+    """
+
+    def __init__(self, path: Optional[Path], ttl: float, max_entries: Optional[int] = None):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: dict[str, dict] = {}
+        if path and path.exists():
+            try:
+                self._entries = orjson.loads(path.read_bytes())
+            except (OSError, ValueError):
+                pass  # Corrupt cache: start empty
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for `key` if still fresh, else None."""
+        entry = self._fresh_entry(key)
+        return self._copy(entry["data"]) if entry else None
+
+    def put(self, key: str, value: Any):
+        """Store `value` under `key` (no-op when caching is disabled)."""
+        if self.path:
+            self._entries[self._hash(key)] = {"data": value, "cached_at": time.time()}
+
+    def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Any],
+        keep: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        Return the cached value for `key` if still fresh, else fetch it.
+
+        The fetched value is stored unless `keep(value)` is false (e.g. a
+        failed read that should be retried next time).
+        """
+        if not self.path:
+            return fetch()
+
+        entry = self._fresh_entry(key)
+        if entry is None:
+            value = fetch()
+            if keep is not None and not keep(value):
+                return value
+            entry = {"data": value, "cached_at": time.time()}
+            self._entries[self._hash(key)] = entry
+        return self._copy(entry["data"])
+
+    def _fresh_entry(self, key: str) -> Optional[dict]:
+        if not self.path:
+            return None
+        entry = self._entries.get(self._hash(key))
+        if entry and time.time() - entry["cached_at"] < self.ttl:
+            return entry
+        return None
+
+    @staticmethod
+    def _hash(key: str) -> str:
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        # Callers annotate results in place (relevance filter): hand out a copy
+        return orjson.loads(orjson.dumps(value))
+
+    def save(self):
+        """Persist non-expired entries (the most recent `max_entries`, if set)."""
+        if not self.path:
+            return
+
+        cutoff = time.time() - self.ttl
+        entries = [(key, e) for key, e in list(self._entries.items()) if e["cached_at"] >= cutoff]
+        if self.max_entries is not None and len(entries) > self.max_entries:
+            entries.sort(key=lambda entry: entry[1]["cached_at"], reverse=True)
+            del entries[self.max_entries:]
+
+        # Temp file + rename, so a save interrupted midway never corrupts the cache
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_bytes(orjson.dumps(dict(entries)))
+        os.replace(tmp_path, self.path)
@@ -3,18 +3,12 @@ Phantombuster API client for enrichment.
 """
 import os
 import time
-import json
-from pathlib import Path
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional, Union
 import httpx
+import orjson
 
-# Load env
-env_file = Path(__file__).parent.parent.parent.parent / ".env.local"
-if env_file.exists():
-    for line in env_file.read_text().splitlines():
-        if line and not line.startswith('#') and '=' in line:
-            key, value = line.split('=', 1)
-            os.environ.setdefault(key.strip(), value.strip())
+from scripts.scrapers.transport import retry_after, shared_transport
 
 
 class PhantombusterClient:
@@ -28,21 +22,79 @@ class PhantombusterClient:
         "linkedin_activity": "7643306922532979",  # LinkedIn Activity Extractor
     }
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Phantom fields that don't change between runs, reused for PHANTOM_INFO_TTL seconds
+    PHANTOM_INFO_FIELDS = ("id", "name", "scriptId", "orgS3Folder", "s3Folder")
+    PHANTOM_INFO_TTL = 300
+
+    # Where a Phantom's result files are stored
+    RESULT_FILE_URL = "https://phantombuster.s3.amazonaws.com/{org_folder}/{folder}/{file_name}"
+
+    def __init__(self, api_key: Optional[str] = None, transport: Optional[httpx.BaseTransport] = None):
         self.api_key = api_key or os.environ.get("PHANTOMBUSTER_API_KEY")
         if not self.api_key:
             raise ValueError("PHANTOMBUSTER_API_KEY required")
 
+        # A shared transport belongs to the caller, who closes it. Otherwise keep
+        # a small pool of our own: idle connections outlive the longest gap
+        # between status polls (30s), so polling reuses one connection
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = shared_transport(max_connections=8, max_keepalive_connections=4, keepalive_expiry=120.0)
         self.client = httpx.Client(
             headers={"X-Phantombuster-Key-1": self.api_key},
-            timeout=60.0
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            transport=transport
         )
 
+        # Last Phantom details per ID, with the validators to revalidate them
+        self._status_cache: dict[str, dict] = {}
+        # Phantom ID -> (fetched at, static fields), see get_phantom_info
+        self._info_cache: dict[str, tuple[float, dict]] = {}
+
     def get_phantom(self, phantom_id: str) -> dict:
         """Get Phantom details."""
-        resp = self.client.get(f"{self.BASE_URL}/agents/fetch", params={"id": phantom_id})
+        return self._fetch_phantom(phantom_id)[0]
+
+    def get_phantom_info(self, phantom_id: str) -> dict:
+        """
+        Phantom name, script and storage folders (PHANTOM_INFO_FIELDS), fetched
+        at most once per PHANTOM_INFO_TTL. Use get_phantom for the run status.
+        """
+        cached = self._info_cache.get(phantom_id)
+        if cached and time.monotonic() - cached[0] < self.PHANTOM_INFO_TTL:
+            return dict(cached[1])
+
+        phantom = self.get_phantom(phantom_id)
+        info = {field: phantom.get(field) for field in self.PHANTOM_INFO_FIELDS}
+        self._info_cache[phantom_id] = (time.monotonic(), info)
+        return dict(info)
+
+    def _fetch_phantom(self, phantom_id: str) -> tuple[dict, httpx.Response]:
+        """
+        Phantom details and the response they came with (for Retry-After).
+
+        Sent as a conditional GET when the last response had an ETag or
+        Last-Modified: an unchanged Phantom then comes back as an empty 304
+        and the details parsed last time are reused.
+        """
+        cached = self._status_cache.get(phantom_id)
+        headers = {}
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        resp = self.client.get(f"{self.BASE_URL}/agents/fetch", params={"id": phantom_id}, headers=headers)
+        if resp.status_code == 304 and cached:
+            return cached["status"], resp
         resp.raise_for_status()
-        return resp.json()
+
+        status = orjson.loads(resp.content)
+        etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._status_cache[phantom_id] = {"status": status, "etag": etag, "last_modified": last_modified}
+        return status, resp
 
     def launch_phantom(self, phantom_id: str, arguments: Optional[dict] = None) -> dict:
         """Launch a Phantom with optional arguments.
@@ -52,11 +104,11 @@ class PhantombusterClient:
         """
         payload = {"id": phantom_id}
         if arguments:
-            payload["argument"] = json.dumps(arguments)
+            payload["argument"] = orjson.dumps(arguments).decode()
 
         resp = self.client.post(f"{self.BASE_URL}/agents/launch", json=payload)
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
     def get_output(self, phantom_id: str) -> Optional[dict]:
         """Get Phantom output/results."""
@@ -65,34 +117,158 @@ class PhantombusterClient:
             params={"id": phantom_id}
         )
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
-    def wait_for_completion(self, phantom_id: str, timeout: int = 300, poll_interval: int = 10) -> dict:
-        """Wait for Phantom to complete and return results."""
-        start = time.time()
-        initial_launches = None
+    def get_output_url(self, phantom_id: str, file_name: str = "result.csv") -> Optional[str]:
+        """
+        URL of a result file of the Phantom's latest run (result.csv or
+        result.json), or None unless that run finished successfully.
 
-        while time.time() - start < timeout:
-            status = self.get_phantom(phantom_id)
-            nb_launches = status.get("nbLaunches", 0)
-            last_end_type = status.get("lastEndType")
+        Only the Phantom's details are fetched (a conditional GET, usually a
+        304 right after a poll), so callers that pass the file on rather than
+        read it can skip get_output.
+        """
+        status = self.get_phantom(phantom_id)
+        if status.get("lastEndType") != "finished":
+            return None
+        if not status.get("orgS3Folder") or not status.get("s3Folder"):
+            return None
+        return self.RESULT_FILE_URL.format(
+            org_folder=status["orgS3Folder"], folder=status["s3Folder"], file_name=file_name
+        )
 
-            # First iteration: record the initial launch count
-            if initial_launches is None:
-                initial_launches = nb_launches
+    def get_result_records(self, phantom_id: str) -> Optional[list]:
+        """
+        Records of the Phantom's latest run, from its result.json on S3.
 
-            # Check if a new run completed (launch count increased and status is finished)
-            if nb_launches > initial_launches and last_end_type == "finished":
-                print(f"    Phantom completed (launches: {nb_launches})")
-                return self.get_output(phantom_id)
-            elif nb_launches > initial_launches and last_end_type == "error":
-                raise Exception(f"Phantom failed: {status.get('lastEndMessage', 'Unknown error')}")
+        None unless that run finished, or if the file can't be downloaded or
+        decoded (S3 answers 403/404 once Phantombuster has purged it).
+        """
+        url = self.get_output_url(phantom_id, "result.json")
+        if not url:
+            return None
+        # The file is on S3: don't send it the API key
+        request = self.client.build_request("GET", url)
+        del request.headers["X-Phantombuster-Key-1"]
+        try:
+            resp = self.client.send(request)
+            resp.raise_for_status()
+            records = orjson.loads(resp.content)
+        except (httpx.HTTPError, orjson.JSONDecodeError):
+            return None
+        return records if isinstance(records, list) else None
+
+    def wait_for_completion(
+        self,
+        phantom_id: str,
+        timeout: int = 300,
+        poll_interval: float = 2.0,
+        max_poll_interval: float = 30.0
+    ) -> dict:
+        """
+        Wait for Phantom to complete and return results.
 
-            elapsed = int(time.time() - start)
-            print(f"    Waiting... ({elapsed}s / {timeout}s)")
-            time.sleep(poll_interval)
+        Raises if the run fails, the status can't be fetched, or it doesn't
+        finish within `timeout` seconds. See iter_completions for the polling.
+        """
+        for _, result in self.iter_completions([phantom_id], timeout, poll_interval, max_poll_interval):
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+    def wait_for_completion_many(
+        self,
+        phantom_ids: list[str],
+        timeout: int = 300
+    ) -> dict[str, Union[dict, Exception]]:
+        """
+        Wait for several Phantoms at once.
 
-        raise TimeoutError(f"Phantom did not complete within {timeout}s")
+        Returns each Phantom's output, or the exception its wait raised
+        (failure, timeout), keyed by Phantom ID: the total wait is that of the
+        slowest Phantom, not the sum.
+        """
+        results = dict(self.iter_completions(phantom_ids, timeout))
+        return {phantom_id: results[phantom_id] for phantom_id in phantom_ids}
+
+    def iter_completions(
+        self,
+        phantom_ids: list[str],
+        timeout: int = 300,
+        poll_interval: float = 2.0,
+        max_poll_interval: float = 30.0
+    ) -> Iterator[tuple[str, Union[dict, Exception]]]:
+        """
+        Poll Phantoms until each one's next run ends, yielding (Phantom ID,
+        output or exception) as each completes.
+
+        All pending Phantoms are polled together (concurrent requests), then
+        one wait: after `poll_interval` seconds, then 1.5x longer each time up
+        to `max_poll_interval`, so short runs are noticed quickly and long ones
+        don't cost a request every few seconds. A Retry-After sent by the API
+        takes precedence over the schedule.
+        """
+        start = time.monotonic()
+        pending = list(dict.fromkeys(phantom_ids))
+        initial_launches = {}
+        interval = poll_interval
+
+        def _fetch(phantom_id: str):
+            try:
+                return self._fetch_phantom(phantom_id)
+            except Exception as e:
+                return e
+
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+            while True:
+                still_running = []
+                delay = None
+                for phantom_id, fetched in zip(pending, pool.map(_fetch, pending)):
+                    if isinstance(fetched, Exception):
+                        yield phantom_id, fetched
+                        continue
+
+                    status, resp = fetched
+                    nb_launches = status.get("nbLaunches", 0)
+                    last_end_type = status.get("lastEndType")
+
+                    # First poll: record the initial launch count
+                    initial = initial_launches.setdefault(phantom_id, nb_launches)
+
+                    # Check if a new run completed (launch count increased and status is finished)
+                    if nb_launches > initial and last_end_type == "finished":
+                        print(f"    Phantom completed (launches: {nb_launches})")
+                        try:
+                            yield phantom_id, self.get_output(phantom_id)
+                        except Exception as e:
+                            yield phantom_id, e
+                    elif nb_launches > initial and last_end_type == "error":
+                        yield phantom_id, Exception(f"Phantom failed: {status.get('lastEndMessage', 'Unknown error')}")
+                    else:
+                        still_running.append(phantom_id)
+                        requested = retry_after(resp)
+                        if requested is not None:
+                            delay = max(delay or 0.0, requested)
+
+                pending = still_running
+                if not pending:
+                    return
+
+                elapsed = time.monotonic() - start
+                if elapsed >= timeout:
+                    for phantom_id in pending:
+                        yield phantom_id, TimeoutError(f"Phantom did not complete within {timeout}s")
+                    return
+
+                if delay is None:
+                    delay = interval
+                    interval = min(interval * 1.5, max_poll_interval)
+
+                print(f"    Waiting... ({int(elapsed)}s / {timeout}s)")
+                # Always poll once more at the deadline rather than oversleeping it
+                time.sleep(min(delay, timeout - elapsed))
 
     def scrape_linkedin_profile(self, linkedin_url: Optional[str] = None) -> dict:
         """Scrape LinkedIn profile(s).
@@ -173,8 +349,29 @@ class PhantombusterClient:
         self.launch_phantom(phantom_id)  # No arguments - use dashboard config
         return self.wait_for_completion(phantom_id, timeout=timeout)
 
+    def run_scraper_batches(self, timeout: int = 300) -> dict[str, Union[dict, Exception]]:
+        """Launch the Profile Scraper and Activity Extractor together and wait for both.
+
+        Args:
+            timeout: Max wait time in seconds (for each, both run concurrently)
+
+        Returns a dict keyed "linkedin_profile" / "linkedin_activity" with each
+        Phantom's output, or the exception it failed with.
+        """
+        phantoms = {name: self.PHANTOMS.get(name) for name in ("linkedin_profile", "linkedin_activity")}
+        if not all(phantoms.values()):
+            raise ValueError("LinkedIn Profile and Activity Phantoms must both be configured")
+
+        print("  → Launching LinkedIn Profile Scraper + Activity Extractor (using PhantomBuster config)...")
+        for phantom_id in phantoms.values():
+            self.launch_phantom(phantom_id)  # No arguments - use dashboard config
+
+        outputs = self.wait_for_completion_many(list(phantoms.values()), timeout=timeout)
+        return {name: outputs[phantom_id] for name, phantom_id in phantoms.items()}
+
     def close(self):
-        self.client.close()
+        if self._owns_transport:
+            self.client.close()
 
 
 # Quick test
@@ -0,0 +1,39 @@
+"""
+Token bucket rate limiter for the API clients.
+"""
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: refills `rate` tokens per second, up to `capacity`.
+
+    Can be used directly (`acquire()`) or as an httpx request event hook,
+    so every request sent by a client takes one token.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1):
+        """Take `tokens`, sleeping until the bucket has refilled enough."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve now (possibly going negative) so waiting callers are served in order
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def __call__(self, request=None):
+        """httpx event hook: `event_hooks={"request": [bucket]}`."""
+        self.acquire()
@@ -0,0 +1,127 @@
+"""
+Shared HTTP transport for the API clients.
+
+Each client keeps its own httpx.Client (headers, timeout), but clients built
+with the same transport share one connection pool, so keep-alive connections
+and TLS sessions are reused across sources.
+"""
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+logger = logging.getLogger(__name__)
+
+# Rate limited or temporarily unavailable: worth another try
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# A 5xx may come after the server acted on the request: only these are resent
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds asked for by a Retry-After header (delay or HTTP date), if any."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryTransport(httpx.BaseTransport):
+    """
+    Resend requests that got a 429 or 5xx, waiting between attempts.
+
+    The wait is the server's Retry-After when given, else exponential backoff
+    with full jitter, so clients hitting the same quota don't retry in step.
+    429s are retried for any method (the request was refused), 5xx only for
+    idempotent ones. A Retry-After longer than `max_delay` (e.g. a daily quota)
+    is not waited for: the response is returned as is.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        max_attempts: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 60.0
+    ):
+        self._transport = transport
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def _should_retry(self, request: httpx.Request, response: httpx.Response) -> bool:
+        if response.status_code not in RETRY_STATUSES:
+            return False
+        return response.status_code == 429 or request.method in IDEMPOTENT_METHODS
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(1, self.max_attempts + 1):
+            response = self._transport.handle_request(request)
+            if attempt == self.max_attempts or not self._should_retry(request, response):
+                return response
+
+            delay = retry_after(response)
+            if delay is None:
+                delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+            elif delay > self.max_delay:
+                return response
+
+            response.close()
+            logger.info(
+                "HTTP %d from %s, retrying in %.1fs (attempt %d/%d)",
+                response.status_code, request.url.host, delay, attempt + 1, self.max_attempts
+            )
+            time.sleep(delay)
+
+    def close(self):
+        self._transport.close()
+
+
+def shared_transport(
+    max_connections: int = 64,
+    max_keepalive_connections: int = 32,
+    keepalive_expiry: float = 60.0,
+    retries: int = 3,
+    http2: bool = HAS_HTTP2,
+    max_attempts: int = 5
+) -> httpx.BaseTransport:
+    """
+    Create a pooled transport to pass as `transport=` to several clients.
+
+    `retries` only covers connection failures (refused, reset, DNS); 429 and
+    5xx responses are retried with backoff up to `max_attempts` times (see
+    RetryTransport), other HTTP errors are still raised by the clients. HTTP/2
+    is used when the `h2` package is installed (httpx[http2]). Idle connections
+    are kept for `keepalive_expiry` seconds (httpx default: 5), long enough to
+    span the gap between two founders in a batch.
+    """
+    return RetryTransport(
+        httpx.HTTPTransport(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            ),
+            retries=retries,
+            http2=http2
+        ),
+        max_attempts=max_attempts
+    )
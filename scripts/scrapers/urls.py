@@ -0,0 +1,30 @@
+"""
+URL normalization and file names shared by the scrapers.
+"""
+import re
+from urllib.parse import urlsplit
+
+# Query parameters that don't change the page (dropped from dedup keys)
+_TRACKING_PARAMS = ("utm_", "fbclid=", "gclid=")
+
+# Anything but letters, digits and '-' (same as `c.isalnum() or c == '-'`)
+_UNSAFE_SLUG_CHARS = re.compile(r'[^\w-]|_')
+
+
+def url_key(url: str) -> tuple[str, str, str]:
+    """
+    Dedup key for a URL: (host, path, query) with http/https, "www.", a
+    trailing slash, the fragment and tracking parameters ignored.
+    """
+    parts = urlsplit(url)
+    host = (parts.hostname or "").removeprefix("www.")
+    query = "&".join(
+        param for param in parts.query.split("&")
+        if param and not param.startswith(_TRACKING_PARAMS)
+    )
+    return host, parts.path.rstrip("/"), query
+
+
+def safe_slug(name: str) -> str:
+    """File name for a founder: lowercased, spaces to '-', other symbols dropped."""
+    return _UNSAFE_SLUG_CHARS.sub('', name.lower().replace(' ', '-'))
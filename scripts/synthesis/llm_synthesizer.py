@@ -2,34 +2,148 @@
 LLM-powered synthesizer to generate enriched founder profiles.
 """
 import os
-import json
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Union
 from datetime import datetime
+from importlib.util import find_spec
 
-# Load env
-env_file = Path(__file__).parent.parent.parent / ".env.local"
-if env_file.exists():
-    for line in env_file.read_text().splitlines():
-        if line and not line.startswith('#') and '=' in line:
-            key, value = line.split('=', 1)
-            os.environ.setdefault(key.strip(), value.strip())
-
-try:
-    import openai
-    HAS_OPENAI = True
-except ImportError:
-    HAS_OPENAI = False
-
-try:
-    import anthropic
-    HAS_ANTHROPIC = True
-except ImportError:
-    HAS_ANTHROPIC = False
+import orjson
+
+# The SDKs are slow to import: only check they are installed here, and import
+# the one used when a ProfileSynthesizer is created
+HAS_OPENAI = find_spec("openai") is not None
+HAS_ANTHROPIC = find_spec("anthropic") is not None
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from scripts.parsers.models import FounderProfile
+from scripts.scrapers.urls import url_key
+
+
+# Media results given to the LLM: enriched_data key -> (result list, items
+# kept, fields kept). Lists come ranked by relevance when the filter ran, and
+# the per-category lists only repeat the same items
+PROMPT_RESULTS = {
+    "google_results": ("all_results", 10, ("title", "snippet", "url", "category")),
+    "youtube_results": ("all_videos", 10, ("title", "description", "channel_title", "url", "category")),
+}
+PROMPT_MAX_POSTS = 20
+
+# Profiles generated at once by generate_enriched_profiles (each call mostly waits on the LLM)
+MAX_CONCURRENT_SYNTHESES = 8
+
+# Free-text fields: HTML tags removed, cut to _SHORT_TEXT_CHARS characters
+_SHORTENED_FIELDS = frozenset({"snippet", "description"})
+_SHORT_TEXT_CHARS = 200
+_HTML_TAG = re.compile(r"<[^>]+>")
+
+# LinkedIn posts and profile fields (Phantombuster records) are cut to this many characters
+_LONG_TEXT_CHARS = 500
+# Record fields holding the LinkedIn profile a Phantombuster record belongs to
+_PROFILE_URL_KEYS = ("query", "profileUrl", "linkedinProfileUrl")
+
+
+def _compact_results(results, list_key: str, limit: int, fields: tuple[str, ...]) -> list[dict]:
+    """Top `limit` results with only `fields` (missing ones left out)."""
+    items = results.get(list_key, []) if isinstance(results, dict) else results
+    compact = []
+    for item in items[:limit]:
+        entry = {}
+        for field in fields:
+            value = item.get(field)
+            if value is None:
+                continue
+            if field in _SHORTENED_FIELDS and isinstance(value, str):
+                value = _HTML_TAG.sub("", value)[:_SHORT_TEXT_CHARS]
+            entry[field] = value
+        compact.append(entry)
+    return compact
+
+
+def _phantom_records(output, linkedin_url: Optional[str]) -> Optional[list[dict]]:
+    """
+    Records of a Phantombuster output (the pipeline adds them to the
+    fetch-output under "result"), or None when it has none. A Phantom's
+    result file accumulates runs: with `linkedin_url`, only the records of
+    that profile are kept (none if no record names it).
+    """
+    if isinstance(output, dict):
+        output = output.get("result")
+    if not isinstance(output, list):
+        return None
+    records = [record for record in output if isinstance(record, dict)]
+
+    if linkedin_url:
+        # LinkedIn profile URLs are case-insensitive
+        wanted = url_key(linkedin_url.lower())
+        records = [
+            record for record in records
+            if any(
+                isinstance(record.get(key), str) and url_key(record[key].lower()) == wanted
+                for key in _PROFILE_URL_KEYS
+            )
+        ]
+    return records
+
+
+def _compact_record(record: dict) -> dict:
+    """`record` without empty fields and with long texts cut."""
+    compact = {}
+    for field, value in record.items():
+        if value in (None, "", [], {}):
+            continue
+        if isinstance(value, str):
+            value = value[:_LONG_TEXT_CHARS]
+        compact[field] = value
+    return compact
+
+
+def _likes(record: dict) -> int:
+    """Like count of a post record (sent as a number or a string)."""
+    try:
+        return int(record.get("likeCount") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _compact_posts(output, linkedin_url: Optional[str], limit: int) -> Union[list[dict], dict]:
+    """
+    Most liked posts first (then most recent), as text, date and likes.
+    Without records, the compacted fetch-output (status and log) instead.
+    """
+    records = _phantom_records(output, linkedin_url)
+    if records is None:
+        return _compact_record(output) if isinstance(output, dict) else []
+    posts = []
+    for record in records:
+        text = record.get("postContent") or record.get("text")
+        if not text or not isinstance(text, str):
+            continue
+        posts.append({
+            "text": text[:_LONG_TEXT_CHARS],
+            "date": record.get("postTimestamp") or record.get("postDate"),
+            "likes": _likes(record),
+        })
+    posts.sort(key=lambda post: (post["likes"], str(post["date"] or "")), reverse=True)
+    return posts[:limit]
+
+
+def _compact_profile(output, linkedin_url: Optional[str]) -> dict:
+    """
+    The scraped LinkedIn profile record, compacted. Without records, the
+    compacted fetch-output (status and log) instead.
+    """
+    records = _phantom_records(output, linkedin_url)
+    if records is None:
+        return _compact_record(output) if isinstance(output, dict) else {}
+    return _compact_record(records[0]) if records else {}
+
+
+def _to_json(data) -> str:
+    """Indented JSON for the prompt (non-ASCII kept as is, like ensure_ascii=False)."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
 
 
 class ProfileSynthesizer:
@@ -47,58 +161,8 @@ Ton output doit être:
 
 Ne fabrique pas d'informations. Si une donnée manque, omets la section."""
 
-    def __init__(self, model: Optional[str] = None):
-        self.llm_provider = None
-        self.llm_client = None
-
-        openai_key = os.environ.get("OPENAI_API_KEY")
-        anthropic_key = os.environ.get("ANTHROPIC_API_KEY")
-
-        if openai_key and HAS_OPENAI:
-            self.llm_provider = "openai"
-            self.llm_client = openai.OpenAI(api_key=openai_key)
-            self.model = model or "gpt-4o"
-        elif anthropic_key and HAS_ANTHROPIC:
-            self.llm_provider = "anthropic"
-            self.llm_client = anthropic.Anthropic(api_key=anthropic_key)
-            self.model = model or "claude-sonnet-4-20250514"
-        else:
-            raise ValueError("OPENAI_API_KEY ou ANTHROPIC_API_KEY requis")
-
-    def synthesize(self, profile: FounderProfile, enriched_data: dict) -> str:
-        """Generate enriched Markdown profile from all collected data."""
-
-        # Build context from all sources
-        context = f"""
-# Données collectées pour {profile.name}
-
-## Profil LinkedIn de base
-- Nom: {profile.name}
-- Titre: {profile.current_position.title if profile.current_position else 'N/A'}
-- Entreprise: {profile.current_position.company if profile.current_position else 'N/A'}
-- Localisation: {profile.location}
-- Industrie: {profile.industry}
-- Résumé: {profile.summary}
-- Description du rôle: {profile.role_description}
-
-## Données enrichies LinkedIn
-{json.dumps(enriched_data.get('linkedin_full', {}), indent=2, ensure_ascii=False)}
-
-## Posts LinkedIn
-{json.dumps(enriched_data.get('linkedin_posts', []), indent=2, ensure_ascii=False)}
-
-## Résultats Google Search
-{json.dumps(enriched_data.get('google_results', []), indent=2, ensure_ascii=False)}
-
-## Vidéos YouTube
-{json.dumps(enriched_data.get('youtube_results', []), indent=2, ensure_ascii=False)}
-"""
-
-        prompt = f"""{context}
-
----
-
-Génère un profil Markdown enrichi et complet pour ce founder.
+    # Same for every founder, sent before the founder's data
+    PROMPT_INSTRUCTIONS = """Génère un profil Markdown enrichi et complet pour ce founder.
 
 Structure attendue:
 ```markdown
@@ -138,36 +202,155 @@ Structure attendue:
 - Localisation: [ville]
 ```
 
-Génère uniquement le Markdown, sans commentaires."""
+Les données collectées suivent."""
+
+    PROMPT_FOOTER = "Génère uniquement le Markdown, sans commentaires."
+
+    def __init__(self, model: Optional[str] = None):
+        self.llm_provider = None
+        self.llm_client = None
+
+        openai_key = os.environ.get("OPENAI_API_KEY")
+        anthropic_key = os.environ.get("ANTHROPIC_API_KEY")
+
+        if openai_key and HAS_OPENAI:
+            import openai
+            self.llm_provider = "openai"
+            self.llm_client = openai.OpenAI(api_key=openai_key)
+            self.model = model or "gpt-4o"
+        elif anthropic_key and HAS_ANTHROPIC:
+            import anthropic
+            self.llm_provider = "anthropic"
+            self.llm_client = anthropic.Anthropic(api_key=anthropic_key)
+            self.model = model or "claude-sonnet-4-20250514"
+        else:
+            raise ValueError("OPENAI_API_KEY ou ANTHROPIC_API_KEY requis")
+
+    def synthesize(self, profile: FounderProfile, enriched_data: dict) -> str:
+        """Generate enriched Markdown profile from all collected data."""
+        return "".join(self.synthesize_stream(profile, enriched_data))
+
+    def synthesize_stream(self, profile: FounderProfile, enriched_data: dict) -> Iterator[str]:
+        """Same as synthesize, yielding the Markdown as the LLM generates it."""
+        founder_data = self._founder_data(profile, enriched_data)
 
         if self.llm_provider == "openai":
-            response = self.llm_client.chat.completions.create(
+            stream = self.llm_client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt}
+                    {"role": "user", "content": f"{self.PROMPT_INSTRUCTIONS}\n\n{founder_data}"}
                 ],
                 max_tokens=4000,
-                temperature=0.3
+                temperature=0.3,
+                stream=True
             )
-            return response.choices[0].message.content
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
 
         elif self.llm_provider == "anthropic":
-            response = self.llm_client.messages.create(
+            with self.llm_client.messages.stream(
                 model=self.model,
                 max_tokens=4000,
                 system=self.SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return response.content[0].text
+                messages=[
+                    {"role": "user", "content": f"{self.PROMPT_INSTRUCTIONS}\n\n{founder_data}"}
+                ]
+            ) as stream:
+                yield from stream.text_stream
+
+    def _founder_data(self, profile: FounderProfile, enriched_data: dict) -> str:
+        """The per-founder part of the user message (after PROMPT_INSTRUCTIONS)."""
+        # Only what the profile needs goes in the prompt (input tokens drive cost and latency)
+        media = {
+            key: _compact_results(enriched_data.get(key, []), list_key, limit, fields)
+            for key, (list_key, limit, fields) in PROMPT_RESULTS.items()
+        }
+        posts = _compact_posts(enriched_data.get('linkedin_posts'), profile.linkedin_url, PROMPT_MAX_POSTS)
+        linkedin_full = _compact_profile(enriched_data.get('linkedin_full'), profile.linkedin_url)
+
+        position = profile.current_position
+        title, company = (position.title, position.company) if position else ('N/A', 'N/A')
+
+        # Build context from all sources
+        context = f"""# Données collectées pour {profile.name}
+
+## Profil LinkedIn de base
+- Nom: {profile.name}
+- Titre: {title}
+- Entreprise: {company}
+- Localisation: {profile.location}
+- Industrie: {profile.industry}
+- Résumé: {profile.summary}
+- Description du rôle: {profile.role_description}
+
+## Données enrichies LinkedIn
+{_to_json(linkedin_full)}
+
+## Posts LinkedIn
+{_to_json(posts)}
+
+## Résultats Google Search
+{_to_json(media['google_results'])}
+
+## Vidéos YouTube
+{_to_json(media['youtube_results'])}
+"""
+
+        return f"""{context}
+---
+
+{self.PROMPT_FOOTER}"""
 
 
-def generate_enriched_profile(profile: FounderProfile, enriched_data: dict, output_path: Path):
+def generate_enriched_profile(
+    profile: FounderProfile,
+    enriched_data: dict,
+    output_path: Path,
+    synthesizer: Optional[ProfileSynthesizer] = None
+):
     """Generate and save enriched profile markdown."""
+    synthesizer = synthesizer or ProfileSynthesizer()
+
+    # Written as it is generated, to a temp file that replaces the profile
+    # once complete: an error leaves the previous profile untouched
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    parts = []
+    try:
+        with tmp_path.open('w', encoding='utf-8') as f:
+            for text in synthesizer.synthesize_stream(profile, enriched_data):
+                f.write(text)
+                parts.append(text)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    print(f"Generated: {output_path}")
+
+    return "".join(parts)
+
+
+def generate_enriched_profiles(
+    jobs: list[tuple[FounderProfile, dict, Path]],
+    max_workers: int = MAX_CONCURRENT_SYNTHESES
+) -> list[Union[str, Exception]]:
+    """
+    Generate and save several enriched profiles concurrently.
+
+    `jobs` are (profile, enriched_data, output_path) tuples, all served by
+    one synthesizer (one LLM client and its connection pool). Returns one
+    entry per job, in order: the Markdown, or the exception it raised.
+    """
+    if not jobs:
+        return []
     synthesizer = ProfileSynthesizer()
-    markdown = synthesizer.synthesize(profile, enriched_data)
 
-    output_path.write_text(markdown, encoding='utf-8')
-    print(f"Generated: {output_path}")
+    def _generate(job: tuple[FounderProfile, dict, Path]):
+        try:
+            return generate_enriched_profile(*job, synthesizer=synthesizer)
+        except Exception as e:
+            return e
 
-    return markdown
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+        return list(pool.map(_generate, jobs))
@@ -0,0 +1,127 @@
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from scripts import batch_scrape
+from scripts.batch_scrape import config_hash, load_checkpoint, save_checkpoint
+
+
+class FakeScraper:
+    """Stands in for FounderScraper: records calls, fails for names in `failing`."""
+
+    failing: set[str] = set()
+    scraped: list[str] = []
+
+    def __init__(self, use_cache=True):
+        self.closed = False
+
+    def scrape_and_save(self, founder_name, company_name=None, max_results=5):
+        if founder_name in self.failing:
+            raise RuntimeError("boom")
+        self.scraped.append(founder_name)
+
+    def save_caches(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class CheckpointTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = Path(self._tmp.name)
+
+    def test_config_hash(self):
+        csv_path = self.dir / "founders.csv"
+        self.assertEqual(config_hash(str(csv_path), 5), config_hash(str(csv_path), 5))
+        self.assertNotEqual(config_hash(str(csv_path), 5), config_hash(str(csv_path), 10))
+        self.assertNotEqual(config_hash(str(csv_path), 5), config_hash(str(self.dir / "other.csv"), 5))
+
+    def test_round_trip(self):
+        path = self.dir / "state" / "checkpoint.json"
+        state = load_checkpoint(path, "abc")
+        self.assertEqual((state["completed"], state["failed"]), ([], []))
+
+        state["completed"] = [0, 2]
+        state["failed"] = [1]
+        save_checkpoint(path, state)
+        self.assertEqual(list(path.parent.iterdir()), [path])  # No temp file left
+
+        loaded = load_checkpoint(path, "abc")
+        self.assertEqual((loaded["completed"], loaded["failed"]), ([0, 2], [1]))
+
+    def test_other_run_or_corrupt_file_starts_over(self):
+        path = self.dir / "checkpoint.json"
+        save_checkpoint(path, {**load_checkpoint(path, "abc"), "completed": [0]})
+        self.assertEqual(load_checkpoint(path, "other")["completed"], [])
+
+        path.write_text("{not json")
+        self.assertEqual(load_checkpoint(path, "abc")["completed"], [])
+
+
+class BatchResumeTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = Path(self._tmp.name)
+        self.csv_path = self.dir / "founders.csv"
+        self.csv_path.write_text(
+            "firstName,lastName,companyName\n"
+            "Ada,Lovelace,Engines\n"
+            "Alan,Turing,Bletchley\n"
+            "Grace,Hopper,Navy\n",
+            encoding="utf-8"
+        )
+
+        FakeScraper.failing = set()
+        FakeScraper.scraped = []
+        for target, value in (
+            ("FounderScraper", FakeScraper),
+            ("CHECKPOINT_PATH", self.dir / "checkpoint.json"),
+            ("OUTPUT_DIR", self.dir / "output"),
+            ("notify_macos", lambda title, message: None),
+        ):
+            patcher = mock.patch.object(batch_scrape, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _run(self, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            batch_scrape.batch_scrape(str(self.csv_path), workers=2, **kwargs)
+
+    def test_resume_skips_completed_and_retries_failed(self):
+        FakeScraper.failing = {"Alan Turing"}
+        self._run()
+        self.assertEqual(sorted(FakeScraper.scraped), ["Ada Lovelace", "Grace Hopper"])
+
+        checkpoint = load_checkpoint(batch_scrape.CHECKPOINT_PATH, config_hash(str(self.csv_path), 5))
+        self.assertEqual((checkpoint["completed"], checkpoint["failed"]), ([0, 2], [1]))
+
+        FakeScraper.failing = set()
+        FakeScraper.scraped = []
+        self._run()
+        self.assertEqual(FakeScraper.scraped, ["Alan Turing"])
+
+        checkpoint = load_checkpoint(batch_scrape.CHECKPOINT_PATH, config_hash(str(self.csv_path), 5))
+        self.assertEqual((checkpoint["completed"], checkpoint["failed"]), ([0, 1, 2], []))
+
+    def test_other_settings_do_not_resume(self):
+        self._run()
+        FakeScraper.scraped = []
+        self._run(max_results=10)
+        self.assertEqual(len(FakeScraper.scraped), 3)
+
+    def test_start_from(self):
+        self._run(start_from=2)
+        self.assertEqual(FakeScraper.scraped, ["Grace Hopper"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import orjson
+
+from scripts.scrapers.cache import ResponseCache
+
+MISS = object()
+
+
+def _put(cache: ResponseCache, key: str, value):
+    cache.get_or_fetch(key, lambda: value)
+
+
+def _cached(cache: ResponseCache, key: str):
+    """The fresh cached value for `key`, or MISS (nothing is stored)."""
+    return cache.get_or_fetch(key, lambda: MISS, keep=lambda value: value is not MISS)
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "cache" / "test_cache.json"
+
+        self.now = 1_000_000.0
+        patcher = mock.patch("scripts.scrapers.cache.time.time", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_fetches_once_within_ttl(self):
+        cache = ResponseCache(self.path, ttl=60)
+        fetch = mock.Mock(return_value={"n": 1})
+        self.assertEqual(cache.get_or_fetch("k", fetch), {"n": 1})
+        self.assertEqual(cache.get_or_fetch("k", fetch), {"n": 1})
+        self.assertEqual(fetch.call_count, 1)
+
+        self.now += 60
+        cache.get_or_fetch("k", fetch)
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_keep_false_is_not_stored(self):
+        cache = ResponseCache(self.path, ttl=60)
+        fetch = mock.Mock(return_value={"success": False})
+        cache.get_or_fetch("k", fetch, keep=lambda value: value["success"])
+        cache.get_or_fetch("k", fetch, keep=lambda value: value["success"])
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_returns_copies(self):
+        cache = ResponseCache(self.path, ttl=60)
+        cache.get_or_fetch("k", lambda: {"items": [1]})["items"].append(2)
+        self.assertEqual(_cached(cache, "k"), {"items": [1]})
+
+    def test_get_and_put(self):
+        cache = ResponseCache(self.path, ttl=60)
+        self.assertIsNone(cache.get("k"))
+        cache.put("k", {"score": 90})
+        self.assertEqual(cache.get("k"), {"score": 90})
+        self.now += 61
+        self.assertIsNone(cache.get("k"))
+
+        disabled = ResponseCache(None, ttl=60)
+        disabled.put("k", 1)
+        self.assertIsNone(disabled.get("k"))
+
+    def test_disabled_without_path(self):
+        cache = ResponseCache(None, ttl=60)
+        fetch = mock.Mock(return_value=1)
+        cache.get_or_fetch("k", fetch)
+        cache.get_or_fetch("k", fetch)
+        self.assertEqual(fetch.call_count, 2)
+        cache.save()
+
+    def test_save_and_reload(self):
+        cache = ResponseCache(self.path, ttl=60)
+        _put(cache, "old", 1)
+        self.now += 30
+        _put(cache, "new", 2)
+        cache.save()
+        self.assertEqual(list(self.path.parent.iterdir()), [self.path])  # No temp file left
+
+        self.assertEqual(_cached(ResponseCache(self.path, ttl=60), "old"), 1)
+
+        # Entries expired at save time are dropped
+        self.now += 40
+        cache.save()
+        reloaded = ResponseCache(self.path, ttl=60)
+        self.assertIs(_cached(reloaded, "old"), MISS)
+        self.assertEqual(_cached(reloaded, "new"), 2)
+
+    def test_save_keeps_most_recent_entries(self):
+        cache = ResponseCache(self.path, ttl=60, max_entries=2)
+        for i in range(4):
+            _put(cache, f"k{i}", i)
+            self.now += 1
+        cache.save()
+
+        self.assertEqual(len(orjson.loads(self.path.read_bytes())), 2)
+        reloaded = ResponseCache(self.path, ttl=60)
+        self.assertEqual([_cached(reloaded, f"k{i}") for i in range(4)], [MISS, MISS, 2, 3])
+
+    def test_corrupt_file_starts_empty(self):
+        self.path.parent.mkdir(parents=True)
+        self.path.write_text("{not json")
+        self.assertIs(_cached(ResponseCache(self.path, ttl=60), "k"), MISS)
+
+
+if __name__ == "__main__":
+    unittest.main()
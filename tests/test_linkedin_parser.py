@@ -0,0 +1,155 @@
+import re
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from scripts.parsers.linkedin_parser import parse_all_profiles, parse_linkedin_md
+
+# Profiles exported from LinkedIn, at the repository root
+EXPORT_ZIP = Path(__file__).resolve().parent.parent / "Founders extract.zip"
+
+
+def _reference_fields(text: str) -> dict:
+    """The fields as the original str-regex parser extracted them, one search per field."""
+    def field(key):
+        match = re.search(r'\*\*' + re.escape(key) + r'\*\*\s*:\s*(.+)', text)
+        return match.group(1).strip() if match else None
+
+    def section(heading):
+        match = re.search(heading + r'\s*\n\n(.+?)(?=\n##|\Z)', text, re.DOTALL)
+        return match.group(1).strip() if match else None
+
+    name_match = re.search(r'^#\s*[^\w]*\s*(.+)$', text, re.MULTILINE)
+    shared = re.search(r'\*\*Connexions partagées\*\*\s*:\s*(\d+)', text)
+    return {
+        "name": re.sub(r'[^\w\s\-\.]', '', name_match.group(1).strip()).strip() if name_match else None,
+        "title": field("Titre"),
+        "company": field("Entreprise"),
+        "duration_role": field("Durée dans le rôle"),
+        "duration_company": field("Durée dans l'entreprise"),
+        "location": field("Localisation"),
+        "industry": field("Industrie"),
+        "connection_degree": field("Degré de connexion"),
+        "linkedin_url": field("Profil LinkedIn"),
+        "shared_connections": int(shared.group(1)) if shared else None,
+        "role_description": section("## Description du rôle"),
+        "summary": section("## Résumé"),
+    }
+
+
+def _fields(profile) -> dict:
+    position = profile.current_position
+    return {
+        "name": profile.name,
+        "title": position.title if position else None,
+        "company": position.company if position else None,
+        "duration_role": position.duration_role if position else None,
+        "duration_company": position.duration_company if position else None,
+        "location": profile.location,
+        "industry": profile.industry,
+        "connection_degree": profile.connection_degree,
+        "linkedin_url": profile.linkedin_url,
+        "shared_connections": profile.shared_connections,
+        "role_description": profile.role_description,
+        "summary": profile.summary,
+    }
+
+
+class ParseLinkedinMdTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = Path(self._tmp.name)
+
+    def _parse(self, text: str):
+        path = self.dir / "profile.md"
+        path.write_text(text, encoding="utf-8")
+        return parse_linkedin_md(path)
+
+    def test_fields(self):
+        profile = self._parse(
+            "# Jane Doe\n\n"
+            "## Position actuelle\n\n"
+            "**Titre** : CEO\n"
+            "**Entreprise** : Acme\n\n"
+            "**Localisation** : Paris\n"
+            "**Connexions partagées** : 12 connexions\n\n"
+            "## Résumé\n\nBuilds things.\n"
+        )
+        self.assertEqual(profile.id, "jane-doe")
+        self.assertEqual(profile.current_position.title, "CEO")
+        self.assertEqual(profile.current_position.company, "Acme")
+        self.assertEqual(profile.location, "Paris")
+        self.assertEqual(profile.shared_connections, 12)
+        self.assertEqual(profile.summary, "Builds things.")
+
+    def test_no_break_spaces_around_colon(self):
+        # French typography puts a (narrow) no-break space before ':'
+        profile = self._parse(
+            "# Jane Doe\n\n"
+            "**Titre**\xa0: CEO\n"
+            "**Entreprise**\u202f:\xa0Acme\n"
+            "**Localisation** :\u202fParis\n\n"
+            "## Résumé\xa0\n\nBuilds things.\n"
+        )
+        self.assertEqual(profile.current_position.title, "CEO")
+        self.assertEqual(profile.current_position.company, "Acme")
+        self.assertEqual(profile.location, "Paris")
+        self.assertEqual(profile.summary, "Builds things.")
+
+    def test_crlf(self):
+        profile = self._parse("# Jane Doe\r\n\r\n**Titre** : CEO\r\n")
+        self.assertEqual(profile.name, "Jane Doe")
+        self.assertEqual(profile.current_position.title, "CEO")
+
+    def test_parse_all_profiles(self):
+        for i in range(3):
+            (self.dir / f"p{i}.md").write_text(f"# Person {i}\n\n**Titre** : CEO\n", encoding="utf-8")
+        (self.dir / "notes.txt").write_text("# Not a profile\n", encoding="utf-8")
+
+        profiles = parse_all_profiles(self.dir)
+        self.assertEqual(sorted(p.id for p in profiles), ["person-0", "person-1", "person-2"])
+
+
+class ParserEquivalenceTest(unittest.TestCase):
+    """The bytes parser extracts the same fields as the original str regexes."""
+
+    SAMPLES = [
+        "# 🚀 Jane Doe\n\n## Position actuelle\n\n**Titre** : CEO & Co-founder\n**Entreprise** : Acme\n"
+        "**Durée dans le rôle** : 2 ans\n**Durée dans l'entreprise** : 3 ans\n\n"
+        "**Localisation** : Lyon, France\n**Industrie** : Logiciels\n\n"
+        "## Description du rôle\n\nBuilds the product.\nHires the team.\n\n"
+        "## Résumé\n\nSerial founder.\n\n## Connexion\n\n"
+        "**Degré de connexion** : 2nd\n**Profil LinkedIn** : https://www.linkedin.com/in/jane\n"
+        "**Connexions partagées** : 7\n",
+        "# José Müller\n\n**Titre**\xa0: Directeur\u202f\n**Entreprise**\u2009:\u00a0Société Générale\n"
+        "## Résumé\u3000\n\nÉcrit en français.\n",
+        "# Name\n\n**Entreprise**:Acme\n**Titre**   :   CTO   \n**Titre** : Ignored\n",
+        "# Name\n\nNo fields at all.\n",
+    ]
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "profile.md"
+
+    def _assert_same(self, text: str, label: str):
+        self.path.write_text(text, encoding="utf-8")
+        self.assertEqual(_fields(parse_linkedin_md(self.path)), _reference_fields(text), label)
+
+    def test_samples(self):
+        for i, text in enumerate(self.SAMPLES):
+            self._assert_same(text, f"sample {i}")
+
+    @unittest.skipUnless(EXPORT_ZIP.exists(), "LinkedIn export not available")
+    def test_exported_profiles(self):
+        with zipfile.ZipFile(EXPORT_ZIP) as archive:
+            names = [name for name in archive.namelist() if name.endswith(".md")]
+            for name in names:
+                self._assert_same(archive.read(name).decode("utf-8"), name)
+
+
+if __name__ == "__main__":
+    unittest.main()
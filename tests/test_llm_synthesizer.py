@@ -0,0 +1,86 @@
+import contextlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.parsers.models import FounderProfile
+from scripts.synthesis.llm_synthesizer import _compact_posts, _compact_profile, generate_enriched_profile
+
+URL = "https://www.linkedin.com/in/jane-doe/"
+
+RECORDS = [
+    {"profileUrl": "https://linkedin.com/in/someone-else", "postContent": "Not hers", "likeCount": 900},
+    {"profileUrl": "https://fr.linkedin.com/in/other", "firstName": "Other"},
+    {"query": "https://linkedin.com/in/Jane-Doe", "postContent": "Hello", "likeCount": "12", "postTimestamp": "2024-01-02"},
+    {"profileUrl": "http://www.linkedin.com/in/jane-doe?utm_source=share", "postContent": "x" * 600, "likeCount": 3},
+]
+
+
+class CompactPhantomOutputTest(unittest.TestCase):
+
+    def test_posts_of_the_profile_only(self):
+        posts = _compact_posts({"output": "log", "result": RECORDS}, URL, limit=20)
+        self.assertEqual([post["likes"] for post in posts], [12, 3])
+        self.assertEqual(posts[0], {"text": "Hello", "date": "2024-01-02", "likes": 12})
+        self.assertEqual(len(posts[1]["text"]), 500)
+
+    def test_no_matching_record(self):
+        self.assertEqual(_compact_posts({"result": RECORDS}, "https://linkedin.com/in/nobody", limit=20), [])
+        self.assertEqual(_compact_profile({"result": RECORDS}, "https://linkedin.com/in/nobody"), {})
+
+    def test_profile_record(self):
+        profile = _compact_profile({"result": [{"profileUrl": URL, "firstName": "Jane", "summary": "", "jobs": []}]}, URL)
+        self.assertEqual(profile, {"profileUrl": URL, "firstName": "Jane"})
+
+    def test_fetch_output_without_records(self):
+        output = {"status": "finished", "output": "log " * 1000, "resultObject": None, "result": None}
+        for compact in (_compact_posts(output, URL, limit=20), _compact_profile(output, URL)):
+            self.assertEqual(compact["status"], "finished")
+            self.assertEqual(len(compact["output"]), 500)
+            self.assertNotIn("result", compact)
+
+        self.assertEqual(_compact_posts([], URL, limit=20), [])
+        self.assertEqual(_compact_profile({}, URL), {})
+
+
+class FakeSynthesizer:
+    """Streams `parts`, then raises `error` if given."""
+
+    def __init__(self, *parts, error=None):
+        self.parts = parts
+        self.error = error
+
+    def synthesize_stream(self, profile, enriched_data):
+        yield from self.parts
+        if self.error:
+            raise self.error
+
+
+class GenerateEnrichedProfileTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "jane-doe.md"
+        self.profile = FounderProfile(id="jane-doe", name="Jane Doe")
+
+    def _generate(self, synthesizer):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return generate_enriched_profile(self.profile, {}, self.path, synthesizer=synthesizer)
+
+    def test_writes_profile(self):
+        self.assertEqual(self._generate(FakeSynthesizer("# Jane", " Doe\n")), "# Jane Doe\n")
+        self.assertEqual(self.path.read_text(encoding="utf-8"), "# Jane Doe\n")
+        self.assertEqual(list(self.path.parent.iterdir()), [self.path])  # No temp file left
+
+    def test_error_keeps_previous_profile(self):
+        self.path.write_text("# Previous\n", encoding="utf-8")
+        with self.assertRaises(RuntimeError):
+            self._generate(FakeSynthesizer("# Half", error=RuntimeError("LLM down")))
+        self.assertEqual(self.path.read_text(encoding="utf-8"), "# Previous\n")
+        self.assertEqual(list(self.path.parent.iterdir()), [self.path])
+
+
+if __name__ == "__main__":
+    unittest.main()
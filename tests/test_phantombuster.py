@@ -0,0 +1,118 @@
+import unittest
+from unittest import mock
+
+import httpx
+
+from scripts.scrapers.linkedin.phantombuster import PhantombusterClient
+
+
+class FakePhantombuster:
+    """
+    MockTransport handler for one Phantom: /agents/fetch answers with
+    `statuses` in turn (the last one repeats), then fetch-output and the
+    result file on S3 (`result`, a 404 when None).
+    """
+
+    def __init__(self, *statuses, headers=None, result=None):
+        self.statuses = list(statuses)
+        self.headers = headers or {}
+        self.result = result
+        self.polls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/agents/fetch"):
+            status = self.statuses[min(self.polls, len(self.statuses) - 1)]
+            self.polls += 1
+            return httpx.Response(200, json={"orgS3Folder": "org", "s3Folder": "ph", **status}, headers=self.headers)
+        if request.url.path.endswith("/agents/fetch-output"):
+            return httpx.Response(200, json={"output": "log"})
+        if request.url.host == "phantombuster.s3.amazonaws.com" and self.result is not None:
+            assert "X-Phantombuster-Key-1" not in request.headers
+            return httpx.Response(200, content=self.result)
+        return httpx.Response(404)
+
+
+RUNNING = {"nbLaunches": 1, "lastEndType": None}
+FINISHED = {"nbLaunches": 2, "lastEndType": "finished"}
+FAILED = {"nbLaunches": 2, "lastEndType": "error", "lastEndMessage": "Session cookie expired"}
+
+
+class IterCompletionsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+        self.sleeps = []
+
+        def sleep(seconds):
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+        module = "scripts.scrapers.linkedin.phantombuster"
+        for target, value in (("time.sleep", sleep), ("time.monotonic", lambda: self.now), ("print", lambda *a: None)):
+            patcher = mock.patch(f"{module}.{target}", value, create=target == "print")
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _client(self, handler):
+        client = PhantombusterClient(api_key="test", transport=httpx.MockTransport(handler))
+        self.addCleanup(client.close)
+        return client
+
+    def test_backoff_until_finished(self):
+        client = self._client(FakePhantombuster(RUNNING, RUNNING, RUNNING, RUNNING, FINISHED))
+        [(phantom_id, output)] = list(client.iter_completions(["p1"], poll_interval=2.0, max_poll_interval=4.0))
+
+        self.assertEqual(phantom_id, "p1")
+        self.assertEqual(output["output"], "log")
+        # 1.5x longer each time, capped at max_poll_interval
+        self.assertEqual(self.sleeps, [2.0, 3.0, 4.0, 4.0])
+
+    def test_retry_after_takes_precedence(self):
+        client = self._client(FakePhantombuster(RUNNING, FINISHED, headers={"Retry-After": "7"}))
+        list(client.iter_completions(["p1"], poll_interval=2.0))
+        self.assertEqual(self.sleeps, [7.0])
+
+    def test_failed_run(self):
+        client = self._client(FakePhantombuster(RUNNING, FAILED))
+        [(_, error)] = list(client.iter_completions(["p1"]))
+        self.assertIsInstance(error, Exception)
+        self.assertIn("Session cookie expired", str(error))
+
+    def test_timeout_polls_once_more_at_the_deadline(self):
+        handler = FakePhantombuster(RUNNING)
+        client = self._client(handler)
+        [(_, error)] = list(client.iter_completions(["p1"], timeout=5, poll_interval=2.0))
+
+        self.assertIsInstance(error, TimeoutError)
+        self.assertEqual(self.sleeps, [2.0, 3.0])
+        self.assertEqual(handler.polls, 3)
+
+
+class ResultFileTest(unittest.TestCase):
+
+    def _client(self, handler):
+        client = PhantombusterClient(api_key="test", transport=httpx.MockTransport(handler))
+        self.addCleanup(client.close)
+        return client
+
+    def test_output_url_only_for_finished_runs(self):
+        self.assertIsNone(self._client(FakePhantombuster(RUNNING)).get_output_url("p1"))
+        self.assertIsNone(self._client(FakePhantombuster(FAILED)).get_output_url("p1"))
+        self.assertEqual(
+            self._client(FakePhantombuster(FINISHED)).get_output_url("p1", "result.json"),
+            "https://phantombuster.s3.amazonaws.com/org/ph/result.json"
+        )
+
+    def test_result_records(self):
+        client = self._client(FakePhantombuster(FINISHED, result=b'[{"postContent": "Hello"}]'))
+        self.assertEqual(client.get_result_records("p1"), [{"postContent": "Hello"}])
+        self.assertEqual(client.get_output("p1"), {"output": "log"})
+
+    def test_result_records_none_when_unavailable(self):
+        self.assertIsNone(self._client(FakePhantombuster(RUNNING, result=b"[]")).get_result_records("p1"))
+        self.assertIsNone(self._client(FakePhantombuster(FINISHED)).get_result_records("p1"))  # S3 404
+        self.assertIsNone(self._client(FakePhantombuster(FINISHED, result=b"<Error>")).get_result_records("p1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from unittest import mock
+
+import httpx
+
+from scripts.scrapers.rate_limit import TokenBucket
+
+
+class FakeClock:
+    """time.monotonic / time.sleep pair where sleeping advances the clock."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TokenBucketTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        for name in ("monotonic", "sleep"):
+            patcher = mock.patch(f"scripts.scrapers.rate_limit.time.{name}", getattr(self.clock, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=2, capacity=3)
+        for _ in range(5):
+            bucket.acquire()
+        # 3 tokens of burst, then one every 1/rate seconds
+        self.assertEqual(self.clock.sleeps, [0.5, 0.5])
+
+    def test_refills_up_to_capacity(self):
+        bucket = TokenBucket(rate=1, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+        self.clock.now += 60
+        bucket.acquire()
+        bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [])
+        bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [1.0])
+
+    def test_default_capacity(self):
+        self.assertEqual(TokenBucket(rate=0.5).capacity, 1)
+        self.assertEqual(TokenBucket(rate=10).capacity, 10)
+
+    def test_event_hook_takes_a_token_per_request(self):
+        bucket = TokenBucket(rate=1, capacity=1)
+        client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+            event_hooks={"request": [bucket]}
+        )
+        with client:
+            client.get("https://api.test/a")
+            client.get("https://api.test/b")
+        self.assertEqual(self.clock.sleeps, [1.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import tempfile
+import unittest
+from importlib.util import find_spec
+from pathlib import Path
+from types import SimpleNamespace
+
+import orjson
+
+HAS_OPENAI = find_spec("openai") is not None
+if HAS_OPENAI:
+    from scripts.enrichment.relevance_filter import RelevanceFilter
+
+
+class FakeCompletions:
+    """chat.completions stand-in answering with the given evaluations."""
+
+    def __init__(self, evaluations=None, error=None):
+        self.evaluations = evaluations or []
+        self.error = error
+        self.prompts = []
+
+    def create(self, messages, **kwargs):
+        self.prompts.append(messages[0]["content"])
+        if self.error:
+            raise self.error
+        message = SimpleNamespace(content=orjson.dumps({"evaluations": self.evaluations}).decode())
+        return SimpleNamespace(choices=[SimpleNamespace(finish_reason="stop", message=message)])
+
+
+def _evaluation(item_id, score, category="interview"):
+    return {"id": item_id, "relevance_score": score, "category": category, "reason": "test"}
+
+
+SOURCES = {
+    "youtube": [
+        {"title": "Talk", "video_id": "v1", "url": "https://youtube.com/watch?v=v1"},
+        {"title": "Vlog", "video_id": "v2", "url": "https://youtube.com/watch?v=v2"},
+    ],
+    "google": [
+        {"title": "Interview", "url": "https://example.com/interview", "snippet": "..."},
+        {"title": "Homonym", "url": "https://example.com/other"},
+    ],
+}
+
+
+@unittest.skipUnless(HAS_OPENAI, "openai is not installed")
+class FilterSourcesTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache_path = Path(self._tmp.name) / "relevance_cache.json"
+
+    def _filter(self, completions):
+        relevance_filter = RelevanceFilter(api_key="test", cache_path=self.cache_path)
+        relevance_filter.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        return relevance_filter
+
+    def test_results_go_back_to_their_source(self):
+        completions = FakeCompletions([
+            _evaluation("youtube:0", 80),
+            _evaluation("youtube:1", 10, "irrelevant"),
+            _evaluation("google:0", 95),
+            _evaluation("google:1", 30, "mention"),
+        ])
+        filtered = self._filter(completions).filter_sources("Jane Doe", "CEO of Acme", SOURCES, min_relevance_score=50)
+
+        self.assertEqual(len(completions.prompts), 1)  # One LLM call for all sources
+        self.assertEqual([r["title"] for r in filtered["youtube"]], ["Talk"])
+        self.assertEqual([r["title"] for r in filtered["google"]], ["Interview"])
+        self.assertEqual(filtered["google"][0]["relevance_score"], 95)
+        self.assertNotIn("relevance_score", SOURCES["google"][0])  # Inputs left untouched
+
+    def test_sorted_by_relevance(self):
+        completions = FakeCompletions([_evaluation("google:0", 60), _evaluation("google:1", 90)])
+        filtered = self._filter(completions).filter_sources("Jane Doe", "", {"google": SOURCES["google"]})
+        self.assertEqual([r["relevance_score"] for r in filtered["google"]], [90, 60])
+
+    def test_cached_decisions_are_not_sent_again(self):
+        completions = FakeCompletions([_evaluation("youtube:0", 80), _evaluation("youtube:1", 70)])
+        relevance_filter = self._filter(completions)
+        relevance_filter.filter_sources("Jane Doe", "", {"youtube": SOURCES["youtube"]})
+        relevance_filter.close()
+
+        # Same videos under another source name, from the saved cache
+        completions = FakeCompletions([_evaluation("google:0", 90)])
+        filtered = self._filter(completions).filter_sources("Jane Doe", "", {"videos": SOURCES["youtube"], "google": SOURCES["google"][:1]})
+
+        self.assertEqual(len(completions.prompts), 1)
+        self.assertNotIn("Talk", completions.prompts[0])
+        self.assertEqual([r["relevance_score"] for r in filtered["videos"]], [80, 70])
+        self.assertEqual(len(filtered["google"]), 1)
+
+    def test_llm_error_returns_sources_unfiltered(self):
+        completions = FakeCompletions(error=RuntimeError("API down"))
+        with self.assertLogs("scripts.enrichment.relevance_filter", "WARNING"):
+            filtered = self._filter(completions).filter_sources("Jane Doe", "", SOURCES)
+        self.assertEqual(filtered, SOURCES)
+
+    def test_filter_results(self):
+        completions = FakeCompletions([_evaluation("r:0", 80), _evaluation("r:1", 20)])
+        filtered = self._filter(completions).filter_results("Jane Doe", "", SOURCES["google"])
+        self.assertEqual([r["title"] for r in filtered], ["Interview"])
+
+
+if __name__ == "__main__":
+    unittest.main()
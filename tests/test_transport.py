@@ -0,0 +1,88 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import mock
+
+import httpx
+
+from scripts.scrapers.transport import RetryTransport, retry_after
+
+
+def _responses(*statuses, headers=None):
+    """MockTransport answering with `statuses` in turn (the last one repeats)."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        status = statuses[min(len(requests), len(statuses)) - 1]
+        return httpx.Response(status, headers=headers if status != 200 else None)
+
+    return httpx.MockTransport(handler), requests
+
+
+class RetryAfterTest(unittest.TestCase):
+
+    def test_seconds(self):
+        self.assertEqual(retry_after(httpx.Response(429, headers={"Retry-After": "3"})), 3.0)
+        self.assertEqual(retry_after(httpx.Response(429, headers={"Retry-After": "-1"})), 0.0)
+
+    def test_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        delay = retry_after(httpx.Response(503, headers={"Retry-After": format_datetime(when, usegmt=True)}))
+        self.assertTrue(25 <= delay <= 30, delay)
+
+    def test_missing_or_invalid(self):
+        self.assertIsNone(retry_after(httpx.Response(429)))
+        self.assertIsNone(retry_after(httpx.Response(429, headers={"Retry-After": "soon"})))
+
+
+@mock.patch("scripts.scrapers.transport.time.sleep")
+class RetryTransportTest(unittest.TestCase):
+
+    def _client(self, transport, **kwargs):
+        client = httpx.Client(transport=RetryTransport(transport, **kwargs))
+        self.addCleanup(client.close)
+        return client
+
+    def test_retries_429_with_retry_after(self, sleep):
+        transport, requests = _responses(429, 200, headers={"Retry-After": "2"})
+        response = self._client(transport).post("https://api.test/x")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(requests), 2)
+        sleep.assert_called_once_with(2.0)
+
+    def test_retries_5xx_for_idempotent_methods_only(self, sleep):
+        transport, requests = _responses(503, 200)
+        self.assertEqual(self._client(transport).get("https://api.test/x").status_code, 200)
+        self.assertEqual(len(requests), 2)
+
+        transport, requests = _responses(503, 200)
+        self.assertEqual(self._client(transport).post("https://api.test/x").status_code, 503)
+        self.assertEqual(len(requests), 1)
+
+    def test_backoff_with_full_jitter(self, sleep):
+        transport, requests = _responses(500)
+        with mock.patch("scripts.scrapers.transport.random.uniform", side_effect=lambda a, b: b) as uniform:
+            response = self._client(transport, max_attempts=4, base_delay=0.5, max_delay=3.0).get("https://api.test/x")
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(len(requests), 4)
+        # 0.5 * 2**attempt, capped at max_delay
+        self.assertEqual([c.args for c in uniform.call_args_list], [(0, 1.0), (0, 2.0), (0, 3.0)])
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [1.0, 2.0, 3.0])
+
+    def test_long_retry_after_is_not_waited_for(self, sleep):
+        transport, requests = _responses(429, 200, headers={"Retry-After": "3600"})
+        response = self._client(transport, max_delay=60.0).get("https://api.test/x")
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(len(requests), 1)
+        sleep.assert_not_called()
+
+    def test_other_errors_are_returned(self, sleep):
+        transport, requests = _responses(404)
+        self.assertEqual(self._client(transport).get("https://api.test/x").status_code, 404)
+        self.assertEqual(len(requests), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
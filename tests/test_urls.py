@@ -0,0 +1,40 @@
+import unittest
+
+from scripts.scrapers.urls import safe_slug, url_key
+
+
+class UrlKeyTest(unittest.TestCase):
+
+    def test_variants_of_the_same_page(self):
+        expected = ("example.com", "/blog/post", "")
+        for url in (
+            "https://example.com/blog/post",
+            "http://www.example.com/blog/post/",
+            "https://example.com/blog/post#comments",
+            "https://EXAMPLE.com/blog/post?utm_source=x&utm_medium=y",
+            "https://example.com/blog/post?fbclid=abc",
+        ):
+            self.assertEqual(url_key(url), expected, url)
+
+    def test_meaningful_query_is_kept(self):
+        self.assertEqual(
+            url_key("https://example.com/watch?v=1&utm_source=x"),
+            ("example.com", "/watch", "v=1")
+        )
+        self.assertNotEqual(url_key("https://example.com/watch?v=1"), url_key("https://example.com/watch?v=2"))
+
+    def test_path_case_and_subdomains_matter(self):
+        self.assertNotEqual(url_key("https://example.com/A"), url_key("https://example.com/a"))
+        self.assertNotEqual(url_key("https://blog.example.com/a"), url_key("https://example.com/a"))
+
+
+class SafeSlugTest(unittest.TestCase):
+
+    def test_slug(self):
+        self.assertEqual(safe_slug("Jane Doe"), "jane-doe")
+        self.assertEqual(safe_slug("José O'Brien_Jr."), "josé-obrienjr")
+        self.assertEqual(safe_slug("../etc/passwd"), "etcpasswd")
+
+
+if __name__ == "__main__":
+    unittest.main()